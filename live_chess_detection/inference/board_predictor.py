@@ -5,14 +5,77 @@ Implements board state prediction from detected pieces
 with FEN generation and position validation.
 """
 
+import cv2
+import hashlib
 import numpy as np
+import re
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
-from ..utils.chess_logic import ChessBoard, validate_fen, square_to_coords, coords_to_square
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    cKDTree = None
+
+from ..utils.chess_logic import (
+    ChessBoard, validate_fen, square_to_coords, coords_to_square, indices_to_fen, PIECE_SYMBOLS
+)
 from ..utils.logger import get_global_logger
 
 
+_SYMBOL_TO_CODE = {symbol: code for code, symbol in enumerate(PIECE_SYMBOLS) if code}
+
+# Pieces farther than this (in pixels) from every board position are dropped;
+# distances are compared squared so no square root is taken
+_MAX_SQUARE_DISTANCE = 100
+_MAX_SQUARE_DISTANCE_SQ = _MAX_SQUARE_DISTANCE ** 2
+
+# Above this many piece-to-position pairs the nearest position is found
+# with a KD-tree instead of the full distance matrix
+_KDTREE_MIN_PAIRS = 4096
+
+# Entries kept in the per-predictor FEN and validation LRU caches
+_MAX_FEN_CACHE = 16
+
+# One rank of a FEN placement field: piece letters and empty-square digits
+_FEN_RANK_PATTERN = re.compile(r'[1-8PNBRQKpnbrqk]+')
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit
+    def _place_pieces_kernel(codes, squares, confidences, board_flat, confidence_flat):
+        """Place pieces in one pass, keeping the most confident per square."""
+        placed = 0
+        for i in range(codes.shape[0]):
+            square = squares[i]
+            if square < 0:
+                continue
+            if board_flat[square] == 0:
+                placed += 1
+            elif confidences[i] <= confidence_flat[square]:
+                # Ties go to the earlier detection
+                continue
+            board_flat[square] = codes[i]
+            confidence_flat[square] = confidences[i]
+        return placed
+    
+    # Compile at import so the first frame is not stalled by the JIT
+    _place_pieces_kernel(
+        np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int64), np.zeros(0),
+        np.zeros(64, dtype=np.int8), np.zeros(64)
+    )
+
+
 class BoardPredictor:
     """
     Board state predictor for chess position analysis.
@@ -25,7 +88,8 @@ class BoardPredictor:
         self,
         board_size: int = 8,
         piece_mapping: Optional[Dict[str, str]] = None,
-        confidence_threshold: float = 0.5
+        confidence_threshold: float = 0.5,
+        reuse_results: bool = False
     ):
         """
         Initialize board predictor.
@@ -34,11 +98,46 @@ class BoardPredictor:
             board_size: Size of chess board (default 8x8)
             piece_mapping: Mapping from detected classes to FEN symbols
             confidence_threshold: Minimum confidence for piece placement
+            reuse_results: Return predictions backed by internal buffers
+                instead of copies (see predict_board_state)
         """
         self.board_size = board_size
         self.confidence_threshold = confidence_threshold
+        self.reuse_results = reuse_results
         self.piece_mapping = piece_mapping or self._get_default_piece_mapping()
         
+        # Image-to-grid homography, keyed on the board corners it was built from
+        self._homography_key = None
+        self._homography = None
+        
+        # Array form of the last board_positions dict, keyed on its identity
+        self._positions_key = None
+        self._positions_cache = None
+        self._positions_tree = None
+        
+        # Class id to piece code table, keyed on the label list it was built from
+        self._labels_key = None
+        self._class_codes = None
+        
+        # (fen, is_valid) per board, and validate_board_state results per FEN;
+        # a static scene keeps producing the same few boards
+        self._fen_cache = OrderedDict()
+        self._validation_cache = OrderedDict()
+        
+        # Board reused by validate_board_state for each new position
+        self._scratch_board = ChessBoard()
+        
+        # Last prediction, reused while the detections do not change
+        self._last_key = None
+        self._last_board_positions = None
+        self._last_result = None
+        
+        # Two board and confidence buffer pairs used in turn, so the arrays
+        # of the previous result stay intact while the next board is built
+        self._board_buffers = [np.zeros((board_size, board_size), dtype=np.int8) for _ in range(2)]
+        self._confidence_buffers = [np.zeros((board_size, board_size)) for _ in range(2)]
+        self._buffer_index = 0
+        
         # Initialize logger
         self.logger = get_global_logger()
     
@@ -53,50 +152,96 @@ class BoardPredictor:
     
     def predict_board_state(
         self,
-        detections: List[Dict],
-        board_positions: Dict[str, Tuple[int, int]]
+        detections: Union[List[Dict], Dict[str, np.ndarray]],
+        board_positions: Dict[str, Tuple[int, int]],
+        board_corners: Optional[np.ndarray] = None,
+        board_bounds: Optional[Tuple[float, float, float, float]] = None
     ) -> Dict[str, Union[str, Dict, List]]:
         """
         Predict board state from detections.
         
         Args:
-            detections: List of piece detections
+            detections: List of piece detections, or the same detections
+                as parallel arrays ('centers', 'confidences' and either
+                'class_ids' with the 'labels' list they index, or
+                'class_names'), such as a detector's 'columns' output
             board_positions: Mapping of board positions to coordinates
+            board_corners: Optional 4x2 board corners (top-left, top-right,
+                bottom-right, bottom-left as seen from white's side). When
+                given, pieces are mapped through the board perspective
+                instead of to the nearest entry in board_positions
+            board_bounds: Optional (x_min, y_min, x_max, y_max) of an
+                axis-aligned, top-down board. When given (and board_corners
+                is not), pieces are bucketed into an even grid over it
             
         Returns:
-            Dictionary containing board state information
+            Dictionary containing board state information; 'board' is an
+            int8 array of PIECE_SYMBOLS codes (0 = empty). Each call returns
+            a result the caller owns. With reuse_results, no copy is made:
+            'board' and 'piece_confidence' are internal buffers that stay
+            valid until the second prediction after this one, and when the
+            detections and board geometry match the previous call the same
+            result object is returned again, so it must not be modified.
         """
         try:
-            # Create empty board
-            board = np.full((self.board_size, self.board_size), '.', dtype=object)
-            piece_confidence = np.zeros((self.board_size, self.board_size))
+            pieces = self._detections_to_arrays(detections)
+            num_detections = pieces['num_detections']
+            
+            # Between moves consecutive frames produce identical detections
+            key = self._detections_key(pieces, num_detections, board_corners, board_bounds)
+            if key == self._last_key and board_positions is self._last_board_positions:
+                return self._export_result(self._last_result)
+            
+            # Clear the buffer pair the previous result does not use (0 = empty)
+            self._buffer_index ^= 1
+            board_codes = self._board_buffers[self._buffer_index]
+            piece_confidence = self._confidence_buffers[self._buffer_index]
+            board_codes.fill(0)
+            piece_confidence.fill(0.0)
             
             # Place pieces on board
-            placed_pieces = 0
-            for detection in detections:
-                if self._place_piece_on_board(detection, board, piece_confidence, board_positions):
-                    placed_pieces += 1
+            if board_corners is not None:
+                squares = self._map_with_perspective(pieces['center'], board_corners)
+            elif board_bounds is not None:
+                squares = self._map_with_grid(pieces['center'], board_bounds)
+            else:
+                squares = self._map_to_closest_squares(pieces['center'], board_positions)
             
-            # Generate FEN from board
-            fen = self._board_to_fen(board)
+            placed_pieces = self._place_pieces_on_board(
+                pieces['code'], squares, pieces['confidence'], board_codes, piece_confidence
+            )
             
-            # Validate FEN
-            is_valid = validate_fen(fen)
+            # Generate and validate the FEN, or reuse them for a board seen recently
+            board_key = board_codes.tobytes()
+            cached = self._fen_cache.get(board_key)
+            if cached is not None:
+                self._fen_cache.move_to_end(board_key)
+                fen, is_valid = cached
+            else:
+                fen = self._board_to_fen(board_codes)
+                is_valid = validate_fen(fen)
+                self._remember(self._fen_cache, board_key, (fen, is_valid))
             
             # Get board statistics
-            stats = self._get_board_statistics(board, piece_confidence)
+            stats = self._get_board_statistics(board_codes, piece_confidence)
             
-            return {
+            result = {
                 'success': True,
                 'fen': fen,
                 'is_valid': is_valid,
-                'board': board,
+                'board': board_codes,
                 'piece_confidence': piece_confidence,
                 'placed_pieces': placed_pieces,
-                'total_detections': len(detections),
+                'total_detections': num_detections,
                 'statistics': stats
             }
             
+            self._last_key = key
+            self._last_board_positions = board_positions
+            self._last_result = result
+            
+            return self._export_result(result)
+            
         except Exception as e:
             self.logger.log_error(e, "predict_board_state")
             return {
@@ -106,119 +251,351 @@ class BoardPredictor:
                 'is_valid': False
             }
     
-    def _place_piece_on_board(
+    def _export_result(self, result: Dict) -> Dict:
+        """
+        Hand a prediction to the caller, copying it unless reuse_results is set.
+        
+        Args:
+            result: Prediction backed by the internal buffers
+            
+        Returns:
+            The result itself, or a copy that shares no mutable state with it
+        """
+        if self.reuse_results:
+            return result
+        
+        stats = result['statistics']
+        return dict(
+            result,
+            board=result['board'].copy(),
+            piece_confidence=result['piece_confidence'].copy(),
+            statistics=dict(
+                stats,
+                piece_counts=dict(stats['piece_counts']),
+                low_confidence_pieces=[dict(piece) for piece in stats['low_confidence_pieces']]
+            )
+        )
+    
+    def _detections_to_arrays(
         self,
-        detection: Dict,
-        board: np.ndarray,
-        piece_confidence: np.ndarray,
-        board_positions: Dict[str, Tuple[int, int]]
-    ) -> bool:
+        detections: Union[List[Dict], Dict[str, np.ndarray]]
+    ) -> Dict[str, Union[int, np.ndarray]]:
         """
-        Place piece on board based on detection.
+        Convert detections to parallel arrays of placeable pieces.
+        
+        Detections below the confidence threshold or whose class does not
+        map to a FEN piece symbol are dropped.
         
         Args:
-            detection: Piece detection
-            board: Board array
-            piece_confidence: Confidence array
-            board_positions: Board position mapping
+            detections: List of piece detections or dictionary of parallel arrays
             
         Returns:
-            True if piece was placed successfully
+            Dictionary with 'code' (N,), 'center' (N, 2) and 'confidence' (N,)
+            arrays, and 'num_detections' before filtering
         """
-        if detection['confidence'] < self.confidence_threshold:
-            return False
+        if isinstance(detections, dict):
+            centers = np.asarray(detections['centers'], dtype=np.float32).reshape(-1, 2)
+            confidences = np.asarray(detections['confidences'], dtype=np.float64)
+            num_detections = len(confidences)
+            
+            if 'class_ids' in detections and 'labels' in detections:
+                # One table read per detection instead of a name lookup
+                class_codes = self._get_class_codes(detections['labels'])
+                class_ids = np.asarray(detections['class_ids'], dtype=np.int64)
+                known = (class_ids >= 0) & (class_ids < len(class_codes))
+                codes = np.where(known, class_codes[np.where(known, class_ids, 0)], 0).astype(np.int8)
+            else:
+                # Look up each distinct class name once
+                names, inverse = np.unique(np.asarray(detections['class_names'], dtype=str), return_inverse=True)
+                name_codes = self._codes_for_names(names.tolist())
+                codes = name_codes[inverse.reshape(-1)]
+        else:
+            num_detections = len(detections)
+            centers = np.empty((num_detections, 2), dtype=np.float32)
+            confidences = np.empty(num_detections, dtype=np.float64)
+            codes = np.zeros(num_detections, dtype=np.int8)
+            
+            for i, detection in enumerate(detections):
+                centers[i] = detection['center']
+                confidences[i] = detection['confidence']
+                symbol = self.piece_mapping.get(detection['class_name'])
+                codes[i] = _SYMBOL_TO_CODE.get(symbol, 0)
         
-        class_name = detection['class_name']
-        if class_name not in self.piece_mapping:
-            return False
+        keep = (confidences >= self.confidence_threshold) & (codes > 0)
         
-        fen_symbol = self.piece_mapping[class_name]
-        center = detection['center']
+        return {
+            'code': codes[keep],
+            'center': centers[keep],
+            'confidence': confidences[keep],
+            'num_detections': num_detections
+        }
+    
+    def _codes_for_names(self, names: List[str]) -> np.ndarray:
+        """Map class names to piece codes, 0 for classes without a FEN symbol."""
+        return np.array(
+            [_SYMBOL_TO_CODE.get(self.piece_mapping.get(name), 0) for name in names],
+            dtype=np.int8
+        )
+    
+    def _get_class_codes(self, labels: List[str]) -> np.ndarray:
+        """
+        Get the class id to piece code table for a detector's labels.
         
-        # Find closest board position
-        closest_position = self._find_closest_board_position(center, board_positions)
-        if not closest_position:
-            return False
+        The table is cached on the identity and length of the label list,
+        which a detector keeps until it loads another model.
         
-        # Convert position to board coordinates
-        row, col = square_to_coords(closest_position)
+        Args:
+            labels: Class name of every class id
+            
+        Returns:
+            (C,) int8 array of piece codes
+        """
+        key = (id(labels), len(labels))
+        if key != self._labels_key:
+            # Holding the list keeps its id from being reused by another one
+            self._class_codes = (self._codes_for_names(list(labels)), labels)
+            self._labels_key = key
         
-        # Check if position is already occupied
-        if board[row, col] != '.':
-            # If confidence is higher, replace the piece
-            if detection['confidence'] > piece_confidence[row, col]:
-                board[row, col] = fen_symbol
-                piece_confidence[row, col] = detection['confidence']
-                return True
-            else:
-                return False
-        else:
-            board[row, col] = fen_symbol
-            piece_confidence[row, col] = detection['confidence']
-            return True
+        return self._class_codes[0]
+    
+    @staticmethod
+    def _detections_key(
+        pieces: Dict[str, np.ndarray],
+        num_detections: int,
+        board_corners: Optional[np.ndarray],
+        board_bounds: Optional[Tuple[float, float, float, float]]
+    ) -> bytes:
+        """
+        Compute a 64-bit digest identifying a prediction's inputs.
+        
+        Args:
+            pieces: Arrays from _detections_to_arrays
+            num_detections: Number of raw detections
+            board_corners: Optional board corners
+            board_bounds: Optional board bounding box
+            
+        Returns:
+            8-byte digest
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(num_detections.to_bytes(4, 'little'))
+        digest.update(pieces['code'].tobytes())
+        digest.update(pieces['center'].tobytes())
+        digest.update(pieces['confidence'].tobytes())
+        if board_corners is not None:
+            digest.update(np.ascontiguousarray(board_corners, dtype=np.float32).tobytes())
+        if board_bounds is not None:
+            digest.update(np.asarray(board_bounds, dtype=np.float64).tobytes())
+        
+        return digest.digest()
     
-    def _find_closest_board_position(
+    def _map_to_closest_squares(
         self,
-        center: Tuple[int, int],
+        centers: np.ndarray,
         board_positions: Dict[str, Tuple[int, int]]
-    ) -> Optional[str]:
+    ) -> np.ndarray:
         """
-        Find closest board position to piece center.
+        Map piece centers to the nearest board square.
         
         Args:
-            center: Piece center coordinates
+            centers: (N, 2) array of piece centers
             board_positions: Board position mapping
             
         Returns:
-            Closest board position or None
+            (N,) flat square indices (row * board_size + col), -1 if no
+            square is close enough
         """
-        min_distance = float('inf')
-        closest_position = None
+        squares = np.full(len(centers), -1, dtype=np.int64)
+        if len(centers) == 0 or not board_positions:
+            return squares
         
-        for position, coords in board_positions.items():
-            distance = np.sqrt((center[0] - coords[0])**2 + (center[1] - coords[1])**2)
-            if distance < min_distance:
-                min_distance = distance
-                closest_position = position
+        _, coords, square_indices = self._get_position_arrays(board_positions)
         
-        # Only return if within reasonable distance
-        if min_distance < 100:  # Adjust threshold as needed
-            return closest_position
+        # Large grids or many pieces: log-time lookups instead of N x S distances
+        if SCIPY_AVAILABLE and len(centers) * len(coords) >= _KDTREE_MIN_PAIRS:
+            if self._positions_tree is None:
+                self._positions_tree = cKDTree(coords)
+            distances, closest = self._positions_tree.query(
+                centers.astype(np.float64), k=1, distance_upper_bound=_MAX_SQUARE_DISTANCE
+            )
+            # Pieces with no position in range come back with index S
+            in_range = distances < _MAX_SQUARE_DISTANCE
+            return np.where(in_range, square_indices[np.minimum(closest, len(coords) - 1)], squares)
         
-        return None
+        # (N, S) squared distances from every piece to every square at once
+        diff = centers.astype(np.float64)[:, None, :] - coords[None, :, :]
+        dist_sq = np.einsum('nsk,nsk->ns', diff, diff)
+        closest = dist_sq.argmin(axis=1)
+        in_range = dist_sq[np.arange(len(centers)), closest] < _MAX_SQUARE_DISTANCE_SQ
+        
+        return np.where(in_range, square_indices[closest], squares)
     
-    def _board_to_fen(self, board: np.ndarray) -> str:
+    def _get_position_arrays(
+        self,
+        board_positions: Dict[str, Tuple[int, int]]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
         """
-        Convert board array to FEN string.
+        Get board_positions as parallel arrays.
+        
+        The conversion is cached on the identity and size of the dict,
+        so callers should pass a new dict rather than edit one in place
+        when the board geometry changes.
         
         Args:
-            board: Board array
+            board_positions: Board position mapping
             
         Returns:
-            FEN string
+            (names, (S, 2) float64 coordinates, (S,) flat square indices)
+        """
+        key = (id(board_positions), len(board_positions))
+        if key != self._positions_key:
+            names = list(board_positions)
+            coords = np.asarray(list(board_positions.values()), dtype=np.float64).reshape(-1, 2)
+            square_indices = np.empty(len(names), dtype=np.int64)
+            for i, name in enumerate(names):
+                row, col = square_to_coords(name)
+                square_indices[i] = row * self.board_size + col
+            
+            # Holding the dict keeps its id from being reused by another one
+            self._positions_cache = (names, coords, square_indices, board_positions)
+            self._positions_key = key
+            self._positions_tree = None
+        
+        return self._positions_cache[:3]
+    
+    def _map_with_grid(
+        self,
+        centers: np.ndarray,
+        board_bounds: Tuple[float, float, float, float]
+    ) -> np.ndarray:
+        """
+        Map piece centers to squares of an even grid over the board bounds.
+        
+        Args:
+            centers: (N, 2) array of piece centers
+            board_bounds: (x_min, y_min, x_max, y_max) of the board
+            
+        Returns:
+            (N,) flat square indices, -1 if the piece lies off the board
+        """
+        x_min, y_min, x_max, y_max = board_bounds
+        x_edges = np.linspace(x_min, x_max, self.board_size + 1)
+        y_edges = np.linspace(y_min, y_max, self.board_size + 1)
+        
+        # Bin 0 is before the first edge and bin board_size + 1 past the last
+        cols = np.digitize(centers[:, 0], x_edges) - 1
+        rows = np.digitize(centers[:, 1], y_edges) - 1
+        on_board = (
+            (rows >= 0) & (rows < self.board_size) &
+            (cols >= 0) & (cols < self.board_size)
+        )
+        
+        return np.where(on_board, rows * self.board_size + cols, -1)
+    
+    def _map_with_perspective(
+        self,
+        centers: np.ndarray,
+        board_corners: np.ndarray
+    ) -> np.ndarray:
         """
-        fen_rows = []
+        Map piece centers to board squares through the board perspective.
         
-        for row in board:
-            fen_row = ""
-            empty_count = 0
+        Args:
+            centers: (N, 2) array of piece centers
+            board_corners: 4x2 array of board corners
             
-            for piece in row:
-                if piece == '.':
-                    empty_count += 1
-                else:
-                    if empty_count > 0:
-                        fen_row += str(empty_count)
-                        empty_count = 0
-                    fen_row += piece
+        Returns:
+            (N,) flat square indices, -1 if the piece lies off the board
+        """
+        if len(centers) == 0:
+            return np.empty(0, dtype=np.int64)
+        
+        # All centers go through one perspectiveTransform call
+        points = np.ascontiguousarray(centers, dtype=np.float32).reshape(-1, 1, 2)
+        mapped = cv2.perspectiveTransform(points, self._get_board_homography(board_corners)).reshape(-1, 2)
+        
+        cells = np.floor(mapped).astype(np.int64)
+        on_board = np.all((cells >= 0) & (cells < self.board_size), axis=1)
+        
+        return np.where(on_board, cells[:, 1] * self.board_size + cells[:, 0], -1)
+    
+    def _get_board_homography(self, board_corners: np.ndarray) -> np.ndarray:
+        """
+        Get the homography from image pixels to board grid units.
+        
+        The matrix is cached until the corners change, so a static
+        camera only pays for getPerspectiveTransform once.
+        
+        Args:
+            board_corners: 4x2 array of board corners
             
-            if empty_count > 0:
-                fen_row += str(empty_count)
+        Returns:
+            3x3 homography matrix
+        """
+        corners = np.ascontiguousarray(board_corners, dtype=np.float32).reshape(4, 2)
+        key = corners.tobytes()
+        if key != self._homography_key:
+            size = self.board_size
+            grid_corners = np.float32([[0, 0], [size, 0], [size, size], [0, size]])
+            self._homography = cv2.getPerspectiveTransform(corners, grid_corners)
+            self._homography_key = key
+        
+        return self._homography
+    
+    def _place_pieces_on_board(
+        self,
+        codes: np.ndarray,
+        squares: np.ndarray,
+        confidences: np.ndarray,
+        board_codes: np.ndarray,
+        piece_confidence: np.ndarray
+    ) -> int:
+        """
+        Place pieces on board, keeping the most confident piece per square.
+        
+        Args:
+            codes: (N,) piece codes (indices into PIECE_SYMBOLS)
+            squares: (N,) flat square indices, -1 for unmapped pieces
+            confidences: (N,) detection confidences
+            board_codes: Board array of piece codes (filled in place)
+            piece_confidence: Confidence array (filled in place)
             
-            fen_rows.append(fen_row)
+        Returns:
+            Number of pieces placed on the board
+        """
+        if NUMBA_AVAILABLE:
+            return _place_pieces_kernel(
+                codes, squares, confidences,
+                board_codes.reshape(-1), piece_confidence.reshape(-1)
+            )
+        
+        mapped = squares >= 0
+        codes = codes[mapped]
+        squares = squares[mapped]
+        confidences = confidences[mapped]
+        
+        # Most confident first; the stable sort lets the earlier detection
+        # win ties, and np.unique keeps the first entry per square
+        order = np.argsort(-confidences, kind='stable')
+        _, first = np.unique(squares[order], return_index=True)
+        chosen = order[first]
+        
+        board_codes.reshape(-1)[squares[chosen]] = codes[chosen]
+        piece_confidence.reshape(-1)[squares[chosen]] = confidences[chosen]
         
-        # Join rows with '/'
-        fen = '/'.join(fen_rows)
+        return len(chosen)
+    
+    def _board_to_fen(self, board_codes: np.ndarray) -> str:
+        """
+        Convert board array to FEN string.
+        
+        Args:
+            board_codes: Board array of piece codes
+            
+        Returns:
+            FEN string
+        """
+        fen = indices_to_fen(board_codes)
         
         # Add additional FEN components (simplified)
         fen += " w - - 0 1"  # Default: white to move, no castling, no en passant, move 1
@@ -227,53 +604,55 @@ class BoardPredictor:
     
     def _get_board_statistics(
         self,
-        board: np.ndarray,
+        board_codes: np.ndarray,
         piece_confidence: np.ndarray
     ) -> Dict[str, Union[int, float, List]]:
         """
         Get board statistics.
         
         Args:
-            board: Board array
+            board_codes: Board array of piece codes
             piece_confidence: Confidence array
             
         Returns:
             Dictionary containing board statistics
         """
-        # Count pieces by type
-        piece_counts = {}
-        for piece in board.flatten():
-            if piece != '.':
-                piece_counts[piece] = piece_counts.get(piece, 0) + 1
+        codes = board_codes.ravel()
+        confidences = piece_confidence.ravel()
+        occupied = codes != 0
         
-        # Count pieces by color
-        white_pieces = sum(1 for piece in board.flatten() if piece.isupper() and piece != '.')
-        black_pieces = sum(1 for piece in board.flatten() if piece.islower() and piece != '.')
+        # Count pieces by code in one pass; codes 1-6 are white, 7-12 black
+        code_counts = np.bincount(codes, minlength=len(PIECE_SYMBOLS))
+        piece_counts = {
+            PIECE_SYMBOLS[code]: count
+            for code, count in enumerate(code_counts.tolist()) if code and count
+        }
+        white_pieces = int(code_counts[1:7].sum())
+        black_pieces = int(code_counts[7:].sum())
         
-        # Calculate average confidence
-        occupied_positions = piece_confidence > 0
-        avg_confidence = np.mean(piece_confidence[occupied_positions]) if np.any(occupied_positions) else 0.0
+        # Average confidence over the same occupancy mask used for the counts
+        total_pieces = white_pieces + black_pieces
+        avg_confidence = confidences[occupied].mean() if total_pieces else 0.0
         
         # Find low confidence pieces
         low_confidence_pieces = []
-        for row in range(self.board_size):
-            for col in range(self.board_size):
-                if board[row, col] != '.' and piece_confidence[row, col] < 0.7:
-                    position = coords_to_square(row, col)
-                    low_confidence_pieces.append({
-                        'position': position,
-                        'piece': board[row, col],
-                        'confidence': piece_confidence[row, col]
-                    })
+        size = board_codes.shape[1]
+        for index in np.flatnonzero(occupied & (confidences < 0.7)).tolist():
+            row, col = divmod(index, size)
+            low_confidence_pieces.append({
+                'position': coords_to_square(row, col),
+                'piece': PIECE_SYMBOLS[codes[index]],
+                'confidence': confidences[index]
+            })
         
         return {
-            'total_pieces': white_pieces + black_pieces,
+            'total_pieces': total_pieces,
             'white_pieces': white_pieces,
             'black_pieces': black_pieces,
             'piece_counts': piece_counts,
             'average_confidence': float(avg_confidence),
             'low_confidence_pieces': low_confidence_pieces,
-            'occupied_squares': int(np.sum(board != '.'))
+            'occupied_squares': total_pieces
         }
     
     def validate_board_state(self, fen: str) -> Dict[str, Union[bool, str, List]]:
@@ -286,32 +665,35 @@ class BoardPredictor:
         Returns:
             Dictionary containing validation results
         """
+        cached = self._validation_cache.get(fen)
+        if cached is not None:
+            self._validation_cache.move_to_end(fen)
+            return dict(cached, issues=list(cached['issues']))
+        
+        # Malformed placements, wrong king counts and misplaced pawns are
+        # found without building a board; only a well-formed placement with
+        # one king per side goes on to move generation
+        issues, analyzable = self._precheck_fen(fen)
+        if not analyzable:
+            result = {
+                'is_valid': False,
+                'is_check': False,
+                'is_checkmate': False,
+                'is_stalemate': False,
+                'issues': issues,
+                'fen': fen
+            }
+            self._remember(self._validation_cache, fen, dict(result, issues=list(issues)))
+            return result
+        
         try:
-            # Create chess board from FEN
-            chess_board = ChessBoard(fen)
+            # Load the position into the reused board
+            chess_board = self._scratch_board
+            chess_board.set_fen(fen)
             
             # Check basic validity
             is_valid = chess_board.board.is_valid()
             
-            # Check for impossible positions
-            issues = []
-            
-            # Check king counts
-            white_kings = sum(1 for piece in chess_board.board.piece_map().values() if piece.symbol() == 'K')
-            black_kings = sum(1 for piece in chess_board.board.piece_map().values() if piece.symbol() == 'k')
-            
-            if white_kings != 1:
-                issues.append(f"Invalid white king count: {white_kings}")
-            if black_kings != 1:
-                issues.append(f"Invalid black king count: {black_kings}")
-            
-            # Check pawn positions
-            for square, piece in chess_board.board.piece_map().items():
-                row = 7 - (square // 8)
-                if piece.symbol().lower() == 'p':
-                    if row == 0 or row == 7:  # Pawns on first/last rank
-                        issues.append(f"Pawn on invalid rank: {chess.square_name(square)}")
-            
             # Check for check
             is_check = chess_board.board.is_check()
             
@@ -321,7 +703,7 @@ class BoardPredictor:
             # Check for stalemate
             is_stalemate = chess_board.board.is_stalemate()
             
-            return {
+            result = {
                 'is_valid': is_valid and len(issues) == 0,
                 'is_check': is_check,
                 'is_checkmate': is_checkmate,
@@ -329,6 +711,8 @@ class BoardPredictor:
                 'issues': issues,
                 'fen': fen
             }
+            self._remember(self._validation_cache, fen, dict(result, issues=list(issues)))
+            return result
             
         except Exception as e:
             self.logger.log_error(e, "validate_board_state")
@@ -341,6 +725,60 @@ class BoardPredictor:
                 'fen': fen
             }
     
+    @staticmethod
+    def _remember(cache: OrderedDict, key, value):
+        """Insert into an LRU cache, evicting the oldest entry when full."""
+        cache[key] = value
+        if len(cache) > _MAX_FEN_CACHE:
+            cache.popitem(last=False)
+    
+    @staticmethod
+    def _precheck_fen(fen: str) -> Tuple[List[str], bool]:
+        """
+        Check the FEN placement field with string operations only.
+        
+        Args:
+            fen: FEN string to check
+            
+        Returns:
+            (issues, analyzable) tuple; issues lists parsing errors, king
+            count errors and pawns on the first or last rank, and
+            analyzable is True if the placement is well formed with one
+            king per side
+        """
+        placement = fen.split(' ', 1)[0]
+        ranks = placement.split('/')
+        if len(ranks) != 8:
+            return [f"FEN parsing error: expected 8 ranks, found {len(ranks)}"], False
+        
+        for rank in ranks:
+            if not _FEN_RANK_PATTERN.fullmatch(rank):
+                return [f"FEN parsing error: invalid rank '{rank}'"], False
+            if sum(int(char) if char.isdigit() else 1 for char in rank) != 8:
+                return [f"FEN parsing error: rank '{rank}' does not cover 8 squares"], False
+        
+        issues = []
+        white_kings = placement.count('K')
+        black_kings = placement.count('k')
+        if white_kings != 1:
+            issues.append(f"Invalid white king count: {white_kings}")
+        if black_kings != 1:
+            issues.append(f"Invalid black king count: {black_kings}")
+        analyzable = not issues
+        
+        # Pawns can never stand on the first or last rank
+        for row in (0, 7):
+            col = 0
+            for char in ranks[row]:
+                if char.isdigit():
+                    col += int(char)
+                    continue
+                if char in 'Pp':
+                    issues.append(f"Pawn on invalid rank: {coords_to_square(row, col)}")
+                col += 1
+        
+        return issues, analyzable
+    
     def get_predictor_info(self) -> Dict:
         """Get predictor information."""
         return {
@@ -7,7 +7,10 @@ with frame stabilization and board mapping.
 
 import cv2
 import numpy as np
+import queue
+import threading
 import time
+from collections import deque
 from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
@@ -17,6 +20,24 @@ from ..utils.video_utils import VideoCapture
 from ..utils.logger import get_global_logger
 
 
+# Detections farther than this (in pixels) from every board position are
+# dropped; compared squared so no square root is taken
+_MAX_SQUARE_DISTANCE_SQ = 100 ** 2
+
+# Frames of detections kept for stabilization
+_MAX_HISTORY = 10
+
+# Detections closer than this (in pixels, along both axes) to the first
+# detection of a group count as the same piece
+_GROUP_DISTANCE = 50
+
+# Size (width, height) of the grayscale thumbnail used for stability checks
+_STABILITY_SIZE = (80, 45)
+
+# Thumbnail pixels allowed to exceed motion_threshold in a stable frame
+_MAX_MOTION_PIXELS = 10
+
+
 class LiveChessDetector:
     """
     Live chess piece detector for real-time detection.
@@ -32,7 +53,15 @@ class LiveChessDetector:
         frame_stabilization: bool = True,
         stabilization_threshold: float = 0.02,
         min_detections: int = 3,
-        board_mapping: Optional[Dict] = None
+        board_mapping: Optional[Dict] = None,
+        skip_static_frames: bool = False,
+        change_threshold: float = 12.0,
+        motion_threshold: float = 25.0,
+        backend: str = "pytorch",
+        half: bool = False,
+        img_size: int = 640,
+        opencv_threads: Optional[int] = 1,
+        batch_size: int = 1
     ):
         """
         Initialize live chess detector.
@@ -44,20 +73,55 @@ class LiveChessDetector:
             stabilization_threshold: Threshold for frame stability
             min_detections: Minimum detections for stable state
             board_mapping: Board position mapping
+            skip_static_frames: Whether to reuse the last detection result
+                while the board stays stable and unchanged
+            change_threshold: Largest per-cell gray level change on an 8x8
+                thumbnail that still counts as the same board
+            motion_threshold: Gray level change at which a stability
+                thumbnail pixel counts as moving
+            backend: Inference backend for a YOLO model loaded from a path
+                ('pytorch', 'onnx' or 'tensorrt')
+            half: Run a YOLO model loaded from a path in FP16 on CUDA;
+                off by default so results match full-precision inference
+            img_size: Inference image size for a YOLO model loaded from a
+                path; 320 roughly quarters the cost of the default 640
+            opencv_threads: OpenCV thread count while run_detection_loop
+                runs, leaving the cores to the detector backend; None keeps
+                the OpenCV default
+            batch_size: Most stable frames run_detection_loop queues and
+                passes to the detector in one batch
         """
+        if backend not in ("pytorch", "onnx", "tensorrt"):
+            raise ValueError(f"Unsupported backend: {backend}")
+        
         self.camera_index = camera_index
         self.frame_stabilization = frame_stabilization
         self.stabilization_threshold = stabilization_threshold
         self.min_detections = min_detections
         self.board_mapping = board_mapping or self._get_default_board_mapping()
         
+        # board_mapping as parallel arrays, keyed on the dict they came from
+        self._square_arrays_key = None
+        self._square_arrays = None
+        self.skip_static_frames = skip_static_frames
+        self.change_threshold = change_threshold
+        self.motion_threshold = motion_threshold
+        self.opencv_threads = opencv_threads
+        self.batch_size = max(1, batch_size)
+        
         # Initialize detector
         if isinstance(detector_model, (YOLOChessDetector, InceptionChessDetector)):
             self.detector = detector_model
         else:
             # Try to load as YOLO first, then Inception
             try:
-                self.detector = YOLOChessDetector(str(detector_model))
+                self.detector = YOLOChessDetector(
+                    str(detector_model),
+                    use_tensorrt=backend == "tensorrt",
+                    use_onnx=backend == "onnx",
+                    half=half,
+                    img_size=img_size
+                )
             except Exception:
                 try:
                     self.detector = InceptionChessDetector(str(detector_model))
@@ -66,10 +130,38 @@ class LiveChessDetector:
         
         # Initialize video capture
         self.video_capture = None
-        self.previous_frame = None
-        self.detection_history = []
+        self._previous_thumbnail = None
+        self._checked_thumbnail = (None, None)
+        
+        # Reused output buffers for the stability check
+        self._diff_buffer = np.empty(_STABILITY_SIZE[::-1], dtype=np.uint8)
+        self._motion_buffer = np.empty(_STABILITY_SIZE[::-1], dtype=np.uint8)
+        self.detection_history = deque(maxlen=_MAX_HISTORY)
+        
+        # Per-frame (class, rounded center) signatures of detection_history,
+        # and the history signature and (frame, detection) positions of the
+        # last stable detections computed from it
+        self._history_signatures = deque(maxlen=_MAX_HISTORY)
+        self._stable_key = None
+        self._stable_picks = None
         self.stable_detections = []
         
+        # Detection gating: consecutive stable frames, the board thumbnail
+        # at the last detection, and the result it produced
+        self._stable_count = 0
+        self._detected_thumbnail = None
+        self._last_detection_result = None
+        
+        # Background frame grabber, running while the camera is open
+        self._grabber = None
+        self.frame_timestamp = None
+        
+        # Detection history and the last result are shared between the
+        # capture and inference threads of run_detection_loop
+        self._state_lock = threading.Lock()
+        self._frame_queue = None
+        self._loop_stop = threading.Event()
+        
         # Initialize logger
         self.logger = get_global_logger()
     
@@ -109,7 +201,19 @@ class LiveChessDetector:
                 self.logger.log_error(Exception("Could not open camera"), "start_camera")
                 return False
             
-            self.logger.log_info(f"Camera started: {self.camera_index}", "start_camera")
+            # Compressed MJPG frames keep USB bandwidth and decode cost low
+            self.video_capture.set_codec('MJPG')
+            
+            # Let the driver drop stale frames instead of queueing them
+            self.video_capture.set_property(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
+            # Grab frames on a background thread so capture overlaps inference;
+            # from here on the grabber owns the capture and releases it
+            grabber = _FrameGrabber(self.video_capture)
+            grabber.start()
+            self._grabber = grabber
+            
+            self.logger.log_info("Camera started: %s", "start_camera", self.camera_index)
             return True
             
         except Exception as e:
@@ -118,52 +222,125 @@ class LiveChessDetector:
     
     def stop_camera(self):
         """Stop camera capture."""
-        if self.video_capture:
+        if self._grabber is not None:
+            # The grabber releases the capture once its last read returns,
+            # so a read still blocked in the driver never sees it released
+            if not self._grabber.stop():
+                self.logger.log_warning(
+                    "Capture thread still reading; camera is released when the read returns",
+                    "stop_camera"
+                )
+            self._grabber = None
+        elif self.video_capture:
             self.video_capture.release()
+        
+        if self.video_capture:
             self.video_capture = None
             self.logger.log_info("Camera stopped", "stop_camera")
     
-    def capture_frame(self) -> Optional[np.ndarray]:
+    def capture_frame(self, timeout: float = 1.0) -> Optional[np.ndarray]:
         """
         Capture frame from camera.
         
+        The time the frame was grabbed is stored in frame_timestamp.
+        
+        Args:
+            timeout: Maximum time in seconds to wait for a new frame
+            
         Returns:
-            Captured frame or None if failed
+            Newest captured frame or None if failed
         """
         if not self.video_capture or not self.video_capture.is_opened():
             return None
         
-        ret, frame = self.video_capture.read()
-        if not ret:
+        if self._grabber is None or not self._grabber.is_alive():
             return None
         
+        frame, timestamp = self._grabber.read(timeout)
+        if frame is not None:
+            self.frame_timestamp = timestamp
+        
         return frame
     
     def is_frame_stable(self, current_frame: np.ndarray) -> bool:
         """
         Check if frame is stable.
         
+        Both checks run on a small grayscale thumbnail: the mean absolute
+        difference must stay under stabilization_threshold, and almost no
+        pixel may change by more than motion_threshold.
+        
         Args:
             current_frame: Current frame
             
         Returns:
             True if frame is stable
         """
-        if not self.frame_stabilization or self.previous_frame is None:
+        if not self.frame_stabilization or self._previous_thumbnail is None:
             return True
         
-        # Calculate frame difference
-        diff = cv2.absdiff(current_frame, self.previous_frame)
-        mean_diff = np.mean(diff) / 255.0
+        thumbnail = self._stability_thumbnail(current_frame)
+        diff = cv2.absdiff(thumbnail, self._previous_thumbnail, dst=self._diff_buffer)
+        mean_diff = cv2.mean(diff)[0] / 255.0
+        
+        # Pixels above motion_threshold become 255, the rest 0
+        cv2.threshold(diff, self.motion_threshold, 255, cv2.THRESH_BINARY, dst=self._motion_buffer)
+        motion_pixels = cv2.countNonZero(self._motion_buffer)
         
-        return mean_diff < self.stabilization_threshold
+        return mean_diff < self.stabilization_threshold and motion_pixels < _MAX_MOTION_PIXELS
     
-    def detect_pieces(self, frame: np.ndarray) -> List[Dict]:
+    def _stability_thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Reduce frame to the grayscale thumbnail used for stability checks.
+        
+        The thumbnail of the most recent frame is kept, so the stability
+        check, the board thumbnail and the next frame's reference all
+        share one shrink of the full frame.
+        
+        Args:
+            frame: Input frame
+            
+        Returns:
+            uint8 grayscale thumbnail of _STABILITY_SIZE
+        """
+        checked_frame, checked_thumbnail = self._checked_thumbnail
+        if checked_frame is frame:
+            return checked_thumbnail
+        
+        # A bilinear shrink to 4x the target keeps the area average cheap
+        # while still averaging out sensor noise
+        width, height = _STABILITY_SIZE
+        small = cv2.resize(frame, (width * 4, height * 4), interpolation=cv2.INTER_LINEAR)
+        small = cv2.resize(small, _STABILITY_SIZE, interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        
+        self._checked_thumbnail = (frame, small)
+        return small
+    
+    def _set_previous_frame(self, frame: np.ndarray):
+        """
+        Store frame as the reference for the next stability check.
+        
+        Only its stability thumbnail is kept, not the full frame.
+        
+        Args:
+            frame: Frame to compare the next frame against
+        """
+        # Without stabilization nothing reads the reference frame
+        if self.frame_stabilization:
+            self._previous_thumbnail = self._stability_thumbnail(frame)
+        
+        # Drop the frame reference held for thumbnail reuse
+        self._checked_thumbnail = (None, None)
+    
+    def detect_pieces(self, frame: np.ndarray, timestamp: Optional[float] = None) -> List[Dict]:
         """
         Detect chess pieces in frame.
         
         Args:
             frame: Input frame
+            timestamp: Time the frame was captured; defaults to now
             
         Returns:
             List of piece detections
@@ -172,8 +349,9 @@ class LiveChessDetector:
             results = self.detector.detect(frame)
             detections = results['detections']
             
-            # Add timestamp to detections
-            timestamp = time.time()
+            # Stamp detections with the capture time, not the time inference finished
+            if timestamp is None:
+                timestamp = time.time()
             for detection in detections:
                 detection['timestamp'] = timestamp
             
@@ -183,6 +361,40 @@ class LiveChessDetector:
             self.logger.log_error(e, "detect_pieces")
             return []
     
+    def detect_pieces_batch(self, frames: List[np.ndarray], timestamps: List[Optional[float]]) -> List[List[Dict]]:
+        """
+        Detect chess pieces in several frames with one detector call.
+        
+        Detectors without batched inference fall back to detect_pieces
+        for each frame.
+        
+        Args:
+            frames: Input frames
+            timestamps: Time each frame was captured; None defaults to now
+            
+        Returns:
+            List of piece detections for each frame
+        """
+        if len(frames) == 1 or not hasattr(self.detector, 'detect_batch'):
+            return [self.detect_pieces(frame, timestamp) for frame, timestamp in zip(frames, timestamps)]
+        
+        try:
+            batch_results = self.detector.detect_batch(frames, max_batch=len(frames))
+            
+            now = time.time()
+            all_detections = []
+            for results, timestamp in zip(batch_results, timestamps):
+                detections = results['detections']
+                for detection in detections:
+                    detection['timestamp'] = now if timestamp is None else timestamp
+                all_detections.append(detections)
+            
+            return all_detections
+            
+        except Exception as e:
+            self.logger.log_error(e, "detect_pieces_batch")
+            return [[] for _ in frames]
+    
     def update_detection_history(self, detections: List[Dict]):
         """
         Update detection history for stabilization.
@@ -190,50 +402,87 @@ class LiveChessDetector:
         Args:
             detections: Current detections
         """
+        # The deque drops the oldest frame once it holds _MAX_HISTORY
         self.detection_history.append(detections)
-        
-        # Keep only recent history
-        max_history = 10
-        if len(self.detection_history) > max_history:
-            self.detection_history.pop(0)
+        self._history_signatures.append(tuple(
+            (detection['class_name'], round(detection['center'][0]), round(detection['center'][1]))
+            for detection in detections
+        ))
     
     def get_stable_detections(self) -> List[Dict]:
         """
         Get stable detections from history.
         
+        While a static scene keeps the history signature unchanged, the
+        grouping is not redone; the stable positions found last time are
+        looked up in the current history, so the newest detections are
+        still returned.
+        
         Returns:
             List of stable detections
         """
         if len(self.detection_history) < self.min_detections:
             return []
         
-        # Find detections that appear consistently
-        stable_detections = []
-        
-        # Group detections by position
-        position_groups = {}
-        for detections in self.detection_history:
-            for detection in detections:
-                center = detection['center']
-                # Find nearby detections
-                found_group = False
-                for pos, group in position_groups.items():
-                    if abs(center[0] - pos[0]) < 50 and abs(center[1] - pos[1]) < 50:
-                        group.append(detection)
-                        found_group = True
-                        break
+        history = list(self.detection_history)
+        key = (self.min_detections, tuple(self._history_signatures))
+        if len(key[1]) != len(history):
+            key = None
+        elif key == self._stable_key:
+            return [history[frame_index][detection_index] for frame_index, detection_index in self._stable_picks]
+        
+        # Group detections by position: each joins the earliest group whose
+        # first center is near it. Groups are bucketed on a grid of
+        # _GROUP_DISTANCE cells, so only the 3x3 surrounding cells can hold
+        # a match and no scan over all groups is needed
+        # Each group keeps its size and its most recent detection, taking
+        # the first on equal timestamps, so groups are not scanned again
+        anchors = []
+        counts = []
+        newest = []
+        newest_times = []
+        cells = {}
+        for frame_index, detections in enumerate(history):
+            for detection_index, detection in enumerate(detections):
+                x, y = detection['center']
+                cell_x = int(x // _GROUP_DISTANCE)
+                cell_y = int(y // _GROUP_DISTANCE)
                 
-                if not found_group:
-                    position_groups[center] = [detection]
+                match = None
+                for neighbor_x in (cell_x - 1, cell_x, cell_x + 1):
+                    for neighbor_y in (cell_y - 1, cell_y, cell_y + 1):
+                        # Cell lists are in creation order; stop at the first hit
+                        for index in cells.get((neighbor_x, neighbor_y), ()):
+                            if match is not None and index >= match:
+                                break
+                            anchor_x, anchor_y = anchors[index]
+                            if abs(x - anchor_x) < _GROUP_DISTANCE and abs(y - anchor_y) < _GROUP_DISTANCE:
+                                match = index
+                                break
+                
+                timestamp = detection['timestamp']
+                if match is None:
+                    cells.setdefault((cell_x, cell_y), []).append(len(anchors))
+                    anchors.append((x, y))
+                    counts.append(1)
+                    newest.append((frame_index, detection_index))
+                    newest_times.append(timestamp)
+                else:
+                    counts[match] += 1
+                    if timestamp > newest_times[match]:
+                        newest[match] = (frame_index, detection_index)
+                        newest_times[match] = timestamp
         
         # Keep only groups with enough detections
-        for pos, group in position_groups.items():
-            if len(group) >= self.min_detections:
-                # Get the most recent detection from this group
-                latest_detection = max(group, key=lambda x: x['timestamp'])
-                stable_detections.append(latest_detection)
+        picks = [
+            position for position, count in zip(newest, counts)
+            if count >= self.min_detections
+        ]
+        
+        self._stable_key = key
+        self._stable_picks = picks
         
-        return stable_detections
+        return [history[frame_index][detection_index] for frame_index, detection_index in picks]
     
     def map_to_board_positions(self, detections: List[Dict]) -> Dict[str, Dict]:
         """
@@ -246,30 +495,48 @@ class LiveChessDetector:
             Dictionary mapping board positions to pieces
         """
         board_state = {}
-        
-        for detection in detections:
-            center = detection['center']
-            class_name = detection['class_name']
-            
-            # Find closest board position
-            min_distance = float('inf')
-            closest_position = None
-            
-            for position, coords in self.board_mapping.items():
-                distance = np.sqrt((center[0] - coords[0])**2 + (center[1] - coords[1])**2)
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_position = position
-            
-            if closest_position and min_distance < 100:  # Within reasonable distance
-                board_state[closest_position] = {
-                    'piece': class_name,
+        if not detections or not self.board_mapping:
+            return board_state
+        
+        names, coords = self._get_square_arrays()
+        
+        # Squared distance from every detection to every square in one pass
+        centers = np.array([detection['center'] for detection in detections], dtype=np.float64)
+        diff = centers[:, None, :] - coords[None, :, :]
+        distance_sq = np.einsum('nsk,nsk->ns', diff, diff)
+        closest = distance_sq.argmin(axis=1)
+        in_range = distance_sq[np.arange(len(detections)), closest] < _MAX_SQUARE_DISTANCE_SQ
+        
+        for detection, square, keep in zip(detections, closest.tolist(), in_range.tolist()):
+            if keep:  # Within reasonable distance
+                board_state[names[square]] = {
+                    'piece': detection['class_name'],
                     'confidence': detection['confidence'],
-                    'center': center
+                    'center': detection['center']
                 }
         
         return board_state
     
+    def _get_square_arrays(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Get board_mapping as square names and an (S, 2) coordinate array.
+        
+        The arrays are rebuilt when board_mapping is replaced by another
+        dict or changes size.
+        
+        Returns:
+            (names, coordinates) tuple
+        """
+        key = (id(self.board_mapping), len(self.board_mapping))
+        if key != self._square_arrays_key:
+            names = list(self.board_mapping)
+            coords = np.asarray(list(self.board_mapping.values()), dtype=np.float64).reshape(-1, 2)
+            # Holding the dict keeps its id from being reused by another one
+            self._square_arrays = (names, coords, self.board_mapping)
+            self._square_arrays_key = key
+        
+        return self._square_arrays[:2]
+    
     def process_frame(self) -> Dict:
         """
         Process single frame for detection.
@@ -277,44 +544,141 @@ class LiveChessDetector:
         Returns:
             Dictionary containing detection results
         """
+        frame, timestamp, thumbnail, result = self._capture_stage()
+        if result is None:
+            result = self._detect_stage(frame, timestamp, thumbnail)
+        
+        return result
+    
+    def _capture_stage(self) -> Tuple[Optional[np.ndarray], Optional[float], Optional[np.ndarray], Optional[Dict]]:
+        """
+        Capture a frame and decide whether it needs the detector.
+        
+        Returns:
+            (frame, capture time, board thumbnail, result) tuple; result is
+            None if the frame should be passed to _detect_stage, otherwise
+            it is the final result for the frame
+        """
         frame = self.capture_frame()
         if frame is None:
-            return {'success': False, 'error': 'Failed to capture frame'}
+            return None, None, None, {'success': False, 'error': 'Failed to capture frame'}
+        timestamp = self.frame_timestamp
         
         # Check frame stability
-        is_stable = self.is_frame_stable(frame)
-        if not is_stable:
-            self.previous_frame = frame
-            return {'success': False, 'error': 'Frame not stable'}
+        if not self.is_frame_stable(frame):
+            self._stable_count = 0
+            self._set_previous_frame(frame)
+            return None, None, None, {'success': False, 'error': 'Frame not stable'}
         
-        # Detect pieces
-        detections = self.detect_pieces(frame)
+        self._stable_count += 1
+        
+        thumbnail = self._board_thumbnail(frame)
+        self._set_previous_frame(frame)
+        
+        # A settled, unchanged board gives the same answer; skip the detector
+        with self._state_lock:
+            can_skip = self._can_skip_detection(thumbnail)
+            last_result = self._last_detection_result
+        if can_skip:
+            return frame, timestamp, thumbnail, dict(last_result, frame=frame, detection_skipped=True)
+        
+        return frame, timestamp, thumbnail, None
+    
+    def _detect_stage(
+        self,
+        frame: np.ndarray,
+        timestamp: Optional[float],
+        thumbnail: np.ndarray,
+        detections: Optional[List[Dict]] = None
+    ) -> Dict:
+        """
+        Run detection on a stable frame and update the detection history.
         
-        # Update history
-        self.update_detection_history(detections)
+        Args:
+            frame: Stable frame from _capture_stage
+            timestamp: Time the frame was captured
+            thumbnail: Board thumbnail of the frame
+            detections: Detections already found in the frame by a batched
+                call; detection runs here if None
+            
+        Returns:
+            Dictionary containing detection results
+        """
+        # Detect pieces
+        if detections is None:
+            detections = self.detect_pieces(frame, timestamp)
         
-        # Get stable detections
-        stable_detections = self.get_stable_detections()
+        # Update history and get stable detections
+        with self._state_lock:
+            self.update_detection_history(detections)
+            stable_detections = self.get_stable_detections()
         
         # Map to board positions
         board_state = self.map_to_board_positions(stable_detections)
         
-        # Update previous frame
-        self.previous_frame = frame
-        
-        return {
+        result = {
             'success': True,
             'frame': frame,
             'detections': detections,
             'stable_detections': stable_detections,
             'board_state': board_state,
-            'is_stable': is_stable
+            'is_stable': True,
+            'detection_skipped': False
         }
+        
+        with self._state_lock:
+            self._detected_thumbnail = thumbnail
+            self._last_detection_result = result
+        
+        return result
+    
+    def _board_thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Reduce frame to an 8x8 grayscale grid, one cell per board square.
+        
+        Args:
+            frame: Input frame
+            
+        Returns:
+            8x8 int16 array of mean cell intensities
+        """
+        # Area-average the stability thumbnail rather than shrink the frame again
+        small = self._stability_thumbnail(frame)
+        
+        return cv2.resize(small, (8, 8), interpolation=cv2.INTER_AREA).astype(np.int16)
+    
+    def _can_skip_detection(self, thumbnail: np.ndarray) -> bool:
+        """
+        Check whether the last detection result still describes the board.
+        
+        The detector runs for the first min_detections stable frames so the
+        history can settle, then again only if some square has changed.
+        
+        Args:
+            thumbnail: Board thumbnail of the current frame
+            
+        Returns:
+            True if detection can be skipped
+        """
+        if not self.skip_static_frames or self._last_detection_result is None:
+            return False
+        
+        if self._stable_count <= self.min_detections:
+            return False
+        
+        changed = np.abs(thumbnail - self._detected_thumbnail).max()
+        return changed <= self.change_threshold
     
     def run_detection_loop(self, max_frames: Optional[int] = None) -> List[Dict]:
         """
         Run detection loop for specified number of frames.
         
+        Capture and stability checks run on one thread and detection on
+        another, so the camera keeps being read during inference. Stable
+        frames are passed through a queue of batch_size slots; when it is
+        full, the oldest waiting frame is dropped in favor of the newest.
+        Frames queued while the detector is busy are detected together.
+        
         Args:
             max_frames: Maximum number of frames to process
             
@@ -325,38 +689,214 @@ class LiveChessDetector:
             return []
         
         results = []
-        frame_count = 0
+        self._frame_queue = queue.Queue(maxsize=self.batch_size)
+        self._loop_stop.clear()
+        
+        # The per-frame OpenCV work is small; its thread pool would only
+        # compete with the detector's. Set before the workers start, since
+        # the setting is process-wide.
+        opencv_threads = cv2.getNumThreads()
+        if self.opencv_threads is not None:
+            cv2.setNumThreads(self.opencv_threads)
+        
+        workers = [
+            threading.Thread(target=self._capture_worker, args=(results, max_frames),
+                             name="detection-capture", daemon=True),
+            threading.Thread(target=self._infer_worker, args=(results, max_frames),
+                             name="detection-infer", daemon=True)
+        ]
         
         try:
-            while True:
-                if max_frames and frame_count >= max_frames:
-                    break
-                
-                result = self.process_frame()
-                results.append(result)
-                
-                if result['success']:
-                    self.logger.log_info(
-                        f"Frame {frame_count}: {len(result['detections'])} detections, "
-                        f"{len(result['stable_detections'])} stable",
-                        "run_detection_loop"
-                    )
-                
-                frame_count += 1
+            for worker in workers:
+                worker.start()
+            
+            # Wait in short steps so KeyboardInterrupt reaches this thread
+            while not self._loop_stop.wait(0.1):
+                pass
                 
         except KeyboardInterrupt:
             self.logger.log_info("Detection loop interrupted by user", "run_detection_loop")
         finally:
+            self._loop_stop.set()
+            for worker in workers:
+                worker.join()
+            self._frame_queue = None
             self.stop_camera()
+            cv2.setNumThreads(opencv_threads)
         
         return results
     
+    def _capture_worker(self, results: List[Dict], max_frames: Optional[int]):
+        """
+        Capture frames and queue the stable ones for detection.
+        
+        Args:
+            results: Shared list of detection results
+            max_frames: Maximum number of frames to process
+        """
+        try:
+            while not self._loop_stop.is_set():
+                frame, timestamp, thumbnail, result = self._capture_stage()
+                if result is not None:
+                    self._record_result(results, result, max_frames)
+                    continue
+                
+                item = (frame, timestamp, thumbnail)
+                try:
+                    self._frame_queue.put_nowait(item)
+                except queue.Full:
+                    # Replace the waiting frame; the detector only wants the newest
+                    try:
+                        self._frame_queue.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._frame_queue.put_nowait(item)
+        finally:
+            # Either worker exiting, normally or not, ends the loop
+            self._loop_stop.set()
+    
+    def _infer_worker(self, results: List[Dict], max_frames: Optional[int]):
+        """
+        Run detection on queued frames.
+        
+        Args:
+            results: Shared list of detection results
+            max_frames: Maximum number of frames to process
+        """
+        try:
+            while not self._loop_stop.is_set():
+                try:
+                    items = [self._frame_queue.get(timeout=0.1)]
+                except queue.Empty:
+                    continue
+                
+                # Take whatever else queued up without waiting for more
+                while len(items) < self.batch_size:
+                    try:
+                        items.append(self._frame_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                frames, timestamps, thumbnails = zip(*items)
+                batch_detections = self.detect_pieces_batch(list(frames), list(timestamps))
+                
+                for frame, timestamp, thumbnail, detections in zip(frames, timestamps, thumbnails, batch_detections):
+                    result = self._detect_stage(frame, timestamp, thumbnail, detections)
+                    self._record_result(results, result, max_frames)
+        finally:
+            self._loop_stop.set()
+    
+    def _record_result(self, results: List[Dict], result: Dict, max_frames: Optional[int]):
+        """
+        Append a frame result and stop the loop once max_frames is reached.
+        
+        Args:
+            results: Shared list of detection results
+            result: Result for one frame
+            max_frames: Maximum number of frames to process
+        """
+        with self._state_lock:
+            if self._loop_stop.is_set():
+                return
+            
+            frame_count = len(results)
+            results.append(result)
+            
+            if max_frames and len(results) >= max_frames:
+                self._loop_stop.set()
+        
+        if result['success']:
+            self.logger.log_info(
+                "Frame %d: %d detections, %d stable", "run_detection_loop",
+                frame_count, len(result['detections']), len(result['stable_detections'])
+            )
+    
     def get_detector_info(self) -> Dict:
         """Get detector information."""
         return {
             'camera_index': self.camera_index,
             'frame_stabilization': self.frame_stabilization,
             'stabilization_threshold': self.stabilization_threshold,
+            'motion_threshold': self.motion_threshold,
             'min_detections': self.min_detections,
+            'skip_static_frames': self.skip_static_frames,
+            'opencv_threads': self.opencv_threads,
+            'batch_size': self.batch_size,
             'detector_info': self.detector.get_model_info() if hasattr(self.detector, 'get_model_info') else {}
-        }
\ No newline at end of file
+        }
+
+
+class _FrameGrabber(threading.Thread):
+    """
+    Daemon thread reading camera frames into a single newest-frame slot.
+    
+    A frame the consumer has not picked up yet is overwritten by the next
+    one, so a slow consumer always gets the latest frame, never a backlog.
+    Every read returns a new array, so handed-out frames stay valid. The
+    thread owns the capture and releases it when it stops.
+    """
+    
+    def __init__(self, video_capture: VideoCapture):
+        """
+        Initialize frame grabber.
+        
+        Args:
+            video_capture: Opened capture to read from
+        """
+        super().__init__(name="camera-capture", daemon=True)
+        self.video_capture = video_capture
+        self._condition = threading.Condition()
+        self._frame = None
+        self._timestamp = None
+        self._stop_event = threading.Event()
+    
+    def run(self):
+        """Read frames until stopped, keeping only the newest one."""
+        try:
+            while not self._stop_event.is_set():
+                ret, frame = self.video_capture.read()
+                if not ret:
+                    time.sleep(0.01)
+                    continue
+                timestamp = time.time()
+                
+                with self._condition:
+                    self._frame = frame
+                    self._timestamp = timestamp
+                    self._condition.notify()
+        finally:
+            self.video_capture.release()
+    
+    def read(self, timeout: float) -> Tuple[Optional[np.ndarray], Optional[float]]:
+        """
+        Take the newest frame, waiting for one if the slot is empty.
+        
+        Args:
+            timeout: Maximum time in seconds to wait
+            
+        Returns:
+            (frame, capture time) tuple, (None, None) on timeout
+        """
+        with self._condition:
+            if self._frame is None:
+                self._condition.wait(timeout)
+            
+            frame, timestamp = self._frame, self._timestamp
+            self._frame = None
+            self._timestamp = None
+        
+        return frame, timestamp
+    
+    def stop(self, timeout: float = 1.0) -> bool:
+        """
+        Stop reading and wait for the thread to finish.
+        
+        Args:
+            timeout: Maximum time in seconds to wait
+            
+        Returns:
+            True if the thread finished and released the capture in time
+        """
+        self._stop_event.set()
+        self.join(timeout)
+        return not self.is_alive()
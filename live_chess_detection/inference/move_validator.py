@@ -7,6 +7,7 @@ evaluation for chess positions.
 
 import chess
 import numpy as np
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
@@ -14,6 +15,10 @@ from ..utils.chess_logic import ChessBoard, calculate_material_balance
 from ..utils.logger import get_global_logger
 
 
+# Number of (fen, move) validation results kept by validate_move
+_MAX_VALIDATION_CACHE = 256
+
+
 class MoveValidator:
     """
     Move validator for chess position analysis.
@@ -37,6 +42,12 @@ class MoveValidator:
         self.position_history = position_history or []
         self.max_history = max_history
         
+        # Board reused by validate_move for each new position
+        self._scratch_board = ChessBoard()
+        
+        # validate_move results by (fen, move, analyze), least recently used first
+        self._validation_cache = OrderedDict()
+        
         # Initialize logger
         self.logger = get_global_logger()
     
@@ -44,66 +55,78 @@ class MoveValidator:
         self,
         fen: str,
         move_uci: str,
-        previous_fen: Optional[str] = None
+        previous_fen: Optional[str] = None,
+        analyze: bool = True
     ) -> Dict[str, Union[bool, str, Dict]]:
         """
         Validate a chess move.
         
+        The result depends only on the FEN and the move, so repeated
+        validations are answered from a cache; the position history is
+        still updated on every valid move.
+        
         Args:
             fen: Current position FEN
             move_uci: Move in UCI format
             previous_fen: Previous position FEN (optional)
+            analyze: Whether to add special conditions, position analysis
+                and the game result, or the legal moves for an illegal
+                move; each generates moves, which callers checking only
+                legality can skip and fetch later with get_legal_moves
             
         Returns:
             Dictionary containing validation results
         """
+        key = (fen, move_uci, analyze)
+        cached = self._validation_cache.get(key)
+        if cached is not None:
+            self._validation_cache.move_to_end(key)
+            if cached['is_valid']:
+                self._update_position_history(cached['new_fen'])
+            return self._copy_validation(cached)
+        
         try:
-            # Create chess board from FEN
-            chess_board = ChessBoard(fen)
+            # Load the position into the reused board
+            chess_board = self._scratch_board
+            chess_board.set_fen(fen)
             
-            # Check if move is legal
-            is_legal = chess_board.is_valid_move(move_uci)
-            
-            if not is_legal:
-                return {
+            # make_move checks legality itself and only pushes legal moves,
+            # so a separate is_valid_move check would test it twice. The
+            # rejection is cached, so a candidate that keeps being seen
+            # does not regenerate the legal move list
+            if not chess_board.make_move(move_uci):
+                result = {
                     'is_valid': False,
                     'reason': 'Illegal move',
-                    'legal_moves': self._get_legal_moves(chess_board),
-                    'move': move_uci
-                }
-            
-            # Make the move
-            move_success = chess_board.make_move(move_uci)
-            
-            if not move_success:
-                return {
-                    'is_valid': False,
-                    'reason': 'Move execution failed',
-                    'legal_moves': self._get_legal_moves(chess_board),
                     'move': move_uci
                 }
+                if analyze:
+                    result['legal_moves'] = self._get_legal_moves(chess_board)
+                return self._remember_validation(key, result)
             
             # Get new position
             new_fen = chess_board.get_fen()
             
-            # Check for special conditions
-            special_conditions = self._check_special_conditions(chess_board)
-            
-            # Analyze position
-            position_analysis = self._analyze_position(chess_board)
-            
             # Update history
             self._update_position_history(new_fen)
             
-            return {
+            result = {
                 'is_valid': True,
                 'move': move_uci,
-                'new_fen': new_fen,
-                'special_conditions': special_conditions,
-                'position_analysis': position_analysis,
-                'game_result': chess_board.get_game_result()
+                'new_fen': new_fen
             }
             
+            if analyze:
+                # Check for special conditions
+                result['special_conditions'] = self._check_special_conditions(chess_board)
+                
+                # Analyze position
+                result['position_analysis'] = self._analyze_position(chess_board)
+                
+                result['game_result'] = chess_board.get_game_result()
+            
+            return self._remember_validation(key, result)
+            
         except Exception as e:
             self.logger.log_error(e, "validate_move")
             return {
@@ -112,6 +135,69 @@ class MoveValidator:
                 'move': move_uci
             }
     
+    def _remember_validation(self, key: Tuple[str, str, bool], result: Dict) -> Dict:
+        """
+        Store a validate_move result, evicting the oldest when full.
+        
+        Args:
+            key: (fen, move, analyze) the result belongs to
+            result: Validation result
+            
+        Returns:
+            The result; the cache keeps its own copy
+        """
+        self._validation_cache[key] = self._copy_validation(result)
+        if len(self._validation_cache) > _MAX_VALIDATION_CACHE:
+            self._validation_cache.popitem(last=False)
+        
+        return result
+    
+    @staticmethod
+    def _copy_validation(result: Dict) -> Dict:
+        """
+        Copy a validate_move result so the cached one cannot be changed.
+        
+        Only the containers a caller may edit are copied; the strings,
+        numbers and pin/skewer entries inside them are shared.
+        
+        Args:
+            result: Validation result
+            
+        Returns:
+            Copied result
+        """
+        copied = dict(result)
+        
+        if 'legal_moves' in copied:
+            copied['legal_moves'] = list(copied['legal_moves'])
+        if 'special_conditions' in copied:
+            copied['special_conditions'] = dict(copied['special_conditions'])
+        
+        analysis = copied.get('position_analysis')
+        if analysis is not None:
+            copied['position_analysis'] = dict(
+                analysis,
+                piece_counts=dict(analysis['piece_counts']),
+                pins=list(analysis['pins']),
+                skewers=list(analysis['skewers'])
+            )
+        
+        return copied
+    
+    def get_legal_moves(self, fen: str) -> List[str]:
+        """
+        Get legal moves of a position on demand.
+        
+        Args:
+            fen: Position FEN
+            
+        Returns:
+            List of legal moves in UCI format
+        """
+        chess_board = self._scratch_board
+        chess_board.set_fen(fen)
+        return self._get_legal_moves(chess_board)
+    
     def _get_legal_moves(self, chess_board: ChessBoard) -> List[str]:
         """
         Get list of legal moves from current position.
@@ -122,10 +208,7 @@ class MoveValidator:
         Returns:
             List of legal moves in UCI format
         """
-        legal_moves = []
-        for move in chess_board.board.legal_moves:
-            legal_moves.append(move.uci())
-        return legal_moves
+        return [move.uci() for move in chess_board.board.legal_moves]
     
     def _check_special_conditions(self, chess_board: ChessBoard) -> Dict[str, bool]:
         """
@@ -137,13 +220,20 @@ class MoveValidator:
         Returns:
             Dictionary of special conditions
         """
+        board = chess_board.board
+        
+        # Checkmate and stalemate both mean no legal move; check for one
+        # move once instead of letting each test generate moves itself
+        is_check = board.is_check()
+        has_legal_move = any(board.generate_legal_moves())
+        
         return {
-            'is_check': chess_board.board.is_check(),
-            'is_checkmate': chess_board.board.is_checkmate(),
-            'is_stalemate': chess_board.board.is_stalemate(),
-            'is_insufficient_material': chess_board.board.is_insufficient_material(),
-            'is_seventyfive_moves': chess_board.board.is_seventyfive_moves(),
-            'is_fivefold_repetition': chess_board.board.is_fivefold_repetition()
+            'is_check': is_check,
+            'is_checkmate': is_check and not has_legal_move,
+            'is_stalemate': not is_check and not has_legal_move,
+            'is_insufficient_material': board.is_insufficient_material(),
+            'is_seventyfive_moves': board.is_seventyfive_moves(),
+            'is_fivefold_repetition': board.is_fivefold_repetition()
         }
     
     def _analyze_position(self, chess_board: ChessBoard) -> Dict[str, Union[int, float, List]]:
@@ -169,15 +259,15 @@ class MoveValidator:
         white_pieces = sum(1 for piece in chess_board.board.piece_map().values() if piece.symbol().isupper())
         black_pieces = sum(1 for piece in chess_board.board.piece_map().values() if piece.symbol().islower())
         
-        # Get legal moves count
-        legal_moves_count = len(list(chess_board.board.legal_moves))
+        # Get legal moves count; generated once and shared with the evaluation
+        legal_moves_count = chess_board.board.legal_moves.count()
         
         # Check for pins and skewers
         pins = self._find_pins(chess_board)
         skewers = self._find_skewers(chess_board)
         
         # Calculate position evaluation
-        evaluation = self._evaluate_position(chess_board)
+        evaluation = self._evaluate_position(chess_board, legal_moves_count)
         
         return {
             'material_balance': material_balance,
@@ -244,12 +334,17 @@ class MoveValidator:
         
         return skewers
     
-    def _evaluate_position(self, chess_board: ChessBoard) -> float:
+    def _evaluate_position(
+        self,
+        chess_board: ChessBoard,
+        legal_moves_count: Optional[int] = None
+    ) -> float:
         """
         Evaluate position strength.
         
         Args:
             chess_board: Chess board instance
+            legal_moves_count: Number of legal moves, if already known
             
         Returns:
             Position evaluation score
@@ -258,8 +353,9 @@ class MoveValidator:
         material_balance = calculate_material_balance(chess_board)
         
         # Add mobility bonus
-        legal_moves = len(list(chess_board.board.legal_moves))
-        mobility_bonus = legal_moves * 0.1
+        if legal_moves_count is None:
+            legal_moves_count = chess_board.board.legal_moves.count()
+        mobility_bonus = legal_moves_count * 0.1
         
         # Add center control bonus
         center_control = self._calculate_center_control(chess_board)
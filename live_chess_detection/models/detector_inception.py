@@ -34,6 +34,10 @@ except ImportError:
     InceptionV3 = None
     preprocess_input = None
 
+# ImageNet normalization constants in NCHW broadcast layout
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32).reshape(1, 3, 1, 1)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32).reshape(1, 3, 1, 1)
+
 
 class InceptionChessDetector:
     """
@@ -49,7 +53,8 @@ class InceptionChessDetector:
         backend: str = "torch",
         device: str = "auto",
         confidence_threshold: float = 0.5,
-        input_size: Tuple[int, int] = (299, 299)
+        input_size: Tuple[int, int] = (299, 299),
+        letterbox: bool = False
     ):
         """
         Initialize Inception chess detector.
@@ -60,15 +65,26 @@ class InceptionChessDetector:
             device: Device to run inference on
             confidence_threshold: Minimum confidence for detections
             input_size: Input image size (height, width)
+            letterbox: Resize color images preserving aspect ratio and pad
+                the remainder, instead of stretching to input_size
         """
         self.model_path = model_path
         self.backend = backend
         self.device = self._setup_device(device)
         self.confidence_threshold = confidence_threshold
         self.input_size = input_size
+        self.letterbox = letterbox
         
         self.model = None
         self.class_names = self._get_default_class_names()
+        self._class_labels = list(self.class_names)
+        
+        # Mixed precision is only used for CUDA inference
+        self._use_amp = False
+        
+        # Reused TensorFlow input buffers, allocated on first use
+        self._tf_resized = None
+        self._tf_input = None
         
         if model_path:
             self.load_model(model_path)
@@ -89,6 +105,13 @@ class InceptionChessDetector:
             'black_pawn', 'black_rook', 'black_knight', 'black_bishop', 'black_queen', 'black_king'
         ]
     
+    def _get_class_labels(self, num_classes: int) -> List[str]:
+        """Build a label for every model output index."""
+        return [
+            self.class_names[class_id] if class_id < len(self.class_names) else f'class_{class_id}'
+            for class_id in range(max(num_classes, len(self.class_names)))
+        ]
+    
     def load_model(self, model_path: Union[str, Path]):
         """
         Load Inception model from file.
@@ -126,6 +149,11 @@ class InceptionChessDetector:
             self.model.to(self.device)
             self.model.eval()
             
+            # NHWC layout lets cuDNN pick tensor-core kernels under FP16
+            self._use_amp = torch.device(self.device).type == "cuda"
+            if self._use_amp:
+                self.model = self.model.to(memory_format=torch.channels_last)
+            
         except Exception as e:
             raise RuntimeError(f"Failed to load PyTorch model: {e}")
     
@@ -138,6 +166,13 @@ class InceptionChessDetector:
             # Load model
             self.model = tf.keras.models.load_model(str(model_path))
             
+            # Cache model-derived shapes once instead of reading them per call
+            height, width = self.model.input_shape[1:3]
+            if height and width:
+                self.input_size = (width, height)
+                self._tf_input = None
+            self._class_labels = self._get_class_labels(self.model.output_shape[-1])
+            
         except Exception as e:
             raise RuntimeError(f"Failed to load TensorFlow model: {e}")
     
@@ -158,46 +193,93 @@ class InceptionChessDetector:
         else:
             raise ValueError(f"Unsupported backend: {self.backend}")
     
+    def _letterbox(
+        self,
+        image: np.ndarray,
+        dst: Optional[np.ndarray] = None,
+        pad_value: int = 114
+    ) -> np.ndarray:
+        """
+        Resize a color image to input_size preserving its aspect ratio.
+        
+        Args:
+            image: Input color image
+            dst: Optional (height, width, 3) uint8 buffer to write into
+            pad_value: Gray level used for the padding
+            
+        Returns:
+            Letterboxed image
+        """
+        width, height = self.input_size
+        if dst is None:
+            dst = np.empty((height, width, 3), dtype=np.uint8)
+        
+        image_height, image_width = image.shape[:2]
+        scale = min(width / image_width, height / image_height)
+        new_width = max(int(round(image_width * scale)), 1)
+        new_height = max(int(round(image_height * scale)), 1)
+        pad_x = (width - new_width) // 2
+        pad_y = (height - new_height) // 2
+        
+        dst.fill(pad_value)
+        dst[pad_y:pad_y + new_height, pad_x:pad_x + new_width] = cv2.resize(
+            image, (new_width, new_height)
+        )
+        
+        return dst
+    
     def _preprocess_torch(self, image: np.ndarray) -> torch.Tensor:
         """Preprocess image for PyTorch."""
-        # Convert BGR to RGB
-        if len(image.shape) == 3 and image.shape[2] == 3:
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        if self.letterbox and len(image.shape) == 3 and image.shape[2] == 3:
+            image = self._letterbox(image)
         
-        # Resize image
-        image = cv2.resize(image, self.input_size)
-        
-        # Convert to tensor
-        image = torch.from_numpy(image).float() / 255.0
+        # Resize, scale to [0, 1], swap BGR to RGB and lay out as NCHW in one call
+        swap_rb = len(image.shape) == 3 and image.shape[2] == 3
+        blob = cv2.dnn.blobFromImage(image, 1.0 / 255.0, self.input_size, swapRB=swap_rb)
         
         # Normalize for InceptionV3
-        mean = [0.485, 0.456, 0.406]
-        std = [0.229, 0.224, 0.225]
-        
-        for i in range(3):
-            image[:, :, i] = (image[:, :, i] - mean[i]) / std[i]
+        blob = (blob - IMAGENET_MEAN) / IMAGENET_STD
         
-        # Add batch dimension and rearrange dimensions
-        image = image.permute(2, 0, 1).unsqueeze(0)
+        image = torch.from_numpy(blob).to(self.device)
+        if self._use_amp:
+            image = image.contiguous(memory_format=torch.channels_last)
         
-        return image.to(self.device)
+        return image
     
     def _preprocess_tf(self, image: np.ndarray) -> np.ndarray:
-        """Preprocess image for TensorFlow."""
-        # Convert BGR to RGB
-        if len(image.shape) == 3 and image.shape[2] == 3:
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        """
+        Preprocess image for TensorFlow.
         
-        # Resize image
-        image = cv2.resize(image, self.input_size)
+        Color uint8 images are written into persistent buffers, so the
+        returned array is overwritten by the next call.
+        """
+        if len(image.shape) != 3 or image.shape[2] != 3 or image.dtype != np.uint8:
+            # Resize image
+            image = cv2.resize(image, self.input_size)
+            
+            # Preprocess for InceptionV3
+            image = preprocess_input(image.astype(np.float32))
+            
+            # Add batch dimension
+            return np.expand_dims(image, axis=0)
         
-        # Preprocess for InceptionV3
-        image = preprocess_input(image.astype(np.float32))
+        if self._tf_input is None:
+            width, height = self.input_size
+            self._tf_resized = np.empty((height, width, 3), dtype=np.uint8)
+            self._tf_input = np.empty((1, height, width, 3), dtype=np.float32)
         
-        # Add batch dimension
-        image = np.expand_dims(image, axis=0)
+        # Resize and convert BGR to RGB without allocating
+        if self.letterbox:
+            self._letterbox(image, dst=self._tf_resized)
+        else:
+            cv2.resize(image, self.input_size, dst=self._tf_resized)
+        cv2.cvtColor(self._tf_resized, cv2.COLOR_BGR2RGB, dst=self._tf_resized)
         
-        return image
+        # InceptionV3 scaling to [-1, 1], written straight into the batch buffer
+        np.multiply(self._tf_resized, 1.0 / 127.5, out=self._tf_input[0], casting='unsafe')
+        self._tf_input -= 1.0
+        
+        return self._tf_input
     
     def detect(
         self,
@@ -222,25 +304,39 @@ class InceptionChessDetector:
         
         # Run inference
         if self.backend == "torch":
-            with torch.no_grad():
+            with torch.inference_mode(), torch.autocast(
+                device_type="cuda", dtype=torch.float16, enabled=self._use_amp
+            ):
                 outputs = self.model(processed_image)
-                probabilities = torch.softmax(outputs, dim=1)
-                probabilities = probabilities.cpu().numpy()[0]
+                # Softmax in FP32 to keep probabilities numerically stable
+                device_probabilities = torch.softmax(outputs.float(), dim=1)[0]
+                
+                # Threshold on the device so only passing classes are copied back
+                device_class_ids = torch.nonzero(
+                    device_probabilities >= self.confidence_threshold
+                ).flatten()
+                class_ids = device_class_ids.tolist()
+                confidences = device_probabilities[device_class_ids].tolist()
+                
+                if return_probabilities:
+                    probabilities = device_probabilities.cpu().numpy()
         elif self.backend == "tensorflow":
-            probabilities = self.model.predict(processed_image)[0]
+            probabilities = self._run_tf_model(processed_image)[0]
+            class_ids = np.flatnonzero(probabilities >= self.confidence_threshold)
+            confidences = probabilities[class_ids].tolist()
+            class_ids = class_ids.tolist()
         else:
             raise ValueError(f"Unsupported backend: {self.backend}")
         
-        # Find detections above threshold
+        # Build detections for classes above threshold
         detections = []
-        for class_id, prob in enumerate(probabilities):
-            if prob >= self.confidence_threshold:
-                detection = {
-                    'class_id': class_id,
-                    'class_name': self.class_names[class_id] if class_id < len(self.class_names) else f'class_{class_id}',
-                    'confidence': float(prob)
-                }
-                detections.append(detection)
+        for class_id, prob in zip(class_ids, confidences):
+            detection = {
+                'class_id': class_id,
+                'class_name': self._class_labels[class_id],
+                'confidence': prob
+            }
+            detections.append(detection)
         
         result_dict = {
             'detections': detections,
@@ -282,6 +378,13 @@ class InceptionChessDetector:
         
         return detections
     
+    def _run_tf_model(self, processed_image: np.ndarray) -> np.ndarray:
+        """Run the TensorFlow model on one preprocessed batch."""
+        # Calling a Keras model directly skips predict()'s per-call data pipeline
+        if isinstance(self.model, tf.keras.Model):
+            return self.model(processed_image, training=False).numpy()
+        return self.model.predict(processed_image, verbose=0)
+    
     def get_model_info(self) -> Dict:
         """Get model information."""
         if self.model is None:
@@ -293,6 +396,7 @@ class InceptionChessDetector:
             "device": self.device,
             "confidence_threshold": self.confidence_threshold,
             "input_size": self.input_size,
+            "letterbox": self.letterbox,
             "class_names": self.class_names,
             "num_classes": len(self.class_names)
         }
\ No newline at end of file
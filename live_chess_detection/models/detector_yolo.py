@@ -1,12 +1,14 @@
 """
 YOLOv8-based chess piece detector.
 
-Implements object detection for chess pieces using YOLOv8 architecture
-with support for both PyTorch and TensorFlow backends.
+Implements object detection for chess pieces using YOLOv8 architecture,
+running PyTorch weights directly or as exported ONNX Runtime models and
+TensorRT engines.
 """
 
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
@@ -38,7 +40,11 @@ class YOLOChessDetector:
         model_path: Optional[Union[str, Path]] = None,
         device: str = "auto",
         confidence_threshold: float = 0.5,
-        iou_threshold: float = 0.45
+        iou_threshold: float = 0.45,
+        use_tensorrt: bool = False,
+        use_onnx: bool = False,
+        half: bool = True,
+        img_size: int = 640
     ):
         """
         Initialize YOLO chess detector.
@@ -48,6 +54,14 @@ class YOLOChessDetector:
             device: Device to run inference on ('cpu', 'cuda', 'auto')
             confidence_threshold: Minimum confidence for detections
             iou_threshold: IoU threshold for NMS
+            use_tensorrt: On CUDA, run a TensorRT engine built from the
+                .pt weights (exported once and cached next to them)
+            use_onnx: Run an ONNX Runtime model built from the .pt weights
+                (exported once and cached next to them); ignored when a
+                TensorRT engine is used
+            half: Run inference in FP16 on CUDA devices (ignored on CPU)
+            img_size: Inference image size; frames are letterboxed to it,
+                so smaller sizes trade small-piece accuracy for speed
         """
         if not YOLO_AVAILABLE:
             raise ImportError("ultralytics package is required for YOLO detector")
@@ -56,9 +70,14 @@ class YOLOChessDetector:
         self.device = self._setup_device(device)
         self.confidence_threshold = confidence_threshold
         self.iou_threshold = iou_threshold
+        self.use_tensorrt = use_tensorrt
+        self.use_onnx = use_onnx
+        self.half = half and self.device.startswith("cuda")
+        self.img_size = img_size
         
         self.model = None
         self.class_names = self._get_default_class_names()
+        self._class_labels = list(self.class_names)
         
         if model_path:
             self.load_model(model_path)
@@ -79,6 +98,13 @@ class YOLOChessDetector:
             'black_pawn', 'black_rook', 'black_knight', 'black_bishop', 'black_queen', 'black_king'
         ]
     
+    def _get_class_labels(self, num_classes: int) -> List[str]:
+        """Build a label for every model output index."""
+        return [
+            self.class_names[class_id] if class_id < len(self.class_names) else f'class_{class_id}'
+            for class_id in range(max(num_classes, len(self.class_names)))
+        ]
+    
     def load_model(self, model_path: Union[str, Path]):
         """
         Load YOLO model from file.
@@ -91,11 +117,97 @@ class YOLOChessDetector:
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
         try:
+            if model_path.suffix == ".pt":
+                if self.use_tensorrt and self.device.startswith("cuda"):
+                    engine_path = model_path.with_suffix(".engine")
+                    if not engine_path.exists():
+                        engine_path = self.export_engine(model_path, img_size=self.img_size)
+                    model_path = engine_path
+                elif self.use_onnx:
+                    onnx_path = model_path.with_suffix(".onnx")
+                    if not onnx_path.exists():
+                        onnx_path = self.export_onnx(model_path, img_size=self.img_size)
+                    model_path = onnx_path
+            
             self.model = YOLO(str(model_path))
-            self.model.to(self.device)
+            
+            # Exported engines are bound to the device they were built for
+            if model_path.suffix == ".pt":
+                self.model.to(self.device)
+            
+            self._class_labels = self._get_class_labels(len(self.model.names))
         except Exception as e:
             raise RuntimeError(f"Failed to load model: {e}")
     
+    def export_engine(
+        self,
+        model_path: Union[str, Path],
+        img_size: int = 640,
+        half: bool = True,
+        int8: bool = False,
+        calibration_data: Optional[Union[str, Path]] = None,
+        batch: int = 16,
+        workspace: int = 4
+    ) -> Path:
+        """
+        Export YOLO weights to a TensorRT engine.
+        
+        Args:
+            model_path: Path to .pt weights
+            img_size: Maximum inference image size
+            half: Build the engine with FP16 precision
+            int8: Build the engine with INT8 precision
+            calibration_data: Dataset YAML with representative board images,
+                required for INT8 calibration
+            batch: Maximum batch size of the dynamic engine
+            workspace: TensorRT workspace size in GB
+            
+        Returns:
+            Path to the exported .engine file
+        """
+        if int8 and calibration_data is None:
+            raise ValueError("calibration_data is required for INT8 export")
+        
+        export_args = {
+            'format': 'engine',
+            'imgsz': img_size,
+            'half': half,
+            'int8': int8,
+            'dynamic': True,
+            'batch': batch,
+            'workspace': workspace,
+            'device': self.device
+        }
+        if calibration_data is not None:
+            export_args['data'] = str(calibration_data)
+        
+        return Path(YOLO(str(model_path)).export(**export_args))
+    
+    def export_onnx(
+        self,
+        model_path: Union[str, Path],
+        img_size: int = 640,
+        opset_version: Optional[int] = None
+    ) -> Path:
+        """
+        Export YOLO weights to an ONNX model for ONNX Runtime.
+        
+        Args:
+            model_path: Path to .pt weights
+            img_size: Maximum inference image size
+            opset_version: ONNX opset (ultralytics default if None)
+            
+        Returns:
+            Path to the exported .onnx file
+        """
+        return Path(YOLO(str(model_path)).export(
+            format='onnx',
+            imgsz=img_size,
+            dynamic=True,
+            simplify=True,
+            opset=opset_version
+        ))
+    
     def detect(
         self,
         image: np.ndarray,
@@ -119,38 +231,143 @@ class YOLOChessDetector:
             image,
             conf=self.confidence_threshold,
             iou=self.iou_threshold,
-            device=self.device
+            device=self.device,
+            half=self.half,
+            imgsz=self.img_size
         )
         
-        # Parse results
+        return self._parse_result(results[0], image, return_crops)
+    
+    def detect_batch(
+        self,
+        images: List[np.ndarray],
+        return_crops: bool = False,
+        max_batch: int = 16
+    ) -> List[Dict[str, Union[List[Dict], np.ndarray]]]:
+        """
+        Detect chess pieces in several images with batched inference.
+        
+        Args:
+            images: List of input images
+            return_crops: Whether to return cropped piece images
+            max_batch: Maximum number of images per forward pass
+            
+        Returns:
+            List of detection dictionaries, one per image
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        batch_results = []
+        pending = None
+        
+        # Parse each chunk on a worker thread while the next chunk runs inference
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Chunk large lists so a single forward pass cannot run out of memory
+            for start in range(0, len(images), max_batch):
+                chunk = images[start:start + max_batch]
+                results = self.model(
+                    chunk,
+                    conf=self.confidence_threshold,
+                    iou=self.iou_threshold,
+                    device=self.device,
+                    half=self.half,
+                    imgsz=self.img_size,
+                    verbose=False
+                )
+                
+                # At most one chunk is parsed ahead, bounding memory use
+                if pending is not None:
+                    batch_results.extend(pending.result())
+                pending = executor.submit(self._parse_chunk, chunk, results, return_crops)
+            
+            if pending is not None:
+                batch_results.extend(pending.result())
+        
+        return batch_results
+    
+    def _parse_chunk(
+        self,
+        images: List[np.ndarray],
+        results: List,
+        return_crops: bool = False
+    ) -> List[Dict[str, Union[List[Dict], np.ndarray]]]:
+        """Parse the results of one inference chunk."""
+        return [
+            self._parse_result(result, image, return_crops)
+            for image, result in zip(images, results)
+        ]
+    
+    def _parse_result(
+        self,
+        result,
+        image: np.ndarray,
+        return_crops: bool = False
+    ) -> Dict[str, Union[List[Dict], np.ndarray]]:
+        """
+        Convert one ultralytics result into detection dictionaries.
+        
+        Args:
+            result: Ultralytics result for a single image
+            image: Image the result belongs to
+            return_crops: Whether to return cropped piece images
+            
+        Returns:
+            Dictionary containing detections and optional crops; 'columns'
+            holds the same detections as parallel arrays ('centers',
+            'confidences', 'class_ids', 'class_names') plus 'labels', the
+            class name of every class id
+        """
         detections = []
         crops = []
+        columns = {
+            'centers': np.empty((0, 2), dtype=int),
+            'confidences': np.empty(0, dtype=np.float32),
+            'class_ids': np.empty(0, dtype=int),
+            'class_names': np.empty(0, dtype=object),
+            'labels': self._class_labels
+        }
         
-        for result in results:
-            if result.boxes is not None:
-                boxes = result.boxes.xyxy.cpu().numpy()
-                confidences = result.boxes.conf.cpu().numpy()
-                class_ids = result.boxes.cls.cpu().numpy().astype(int)
+        if result.boxes is not None:
+            # One device-to-host copy; conf and cls are always the last two columns
+            data = result.boxes.data.cpu().numpy()
+            boxes = data[:, :4].astype(int)
+            centers = (boxes[:, :2] + boxes[:, 2:]) // 2
+            class_id_array = data[:, -1].astype(int)
+            columns = {
+                'centers': centers,
+                'confidences': data[:, -2],
+                'class_ids': class_id_array,
+                'class_names': np.asarray(self._class_labels, dtype=object)[class_id_array],
+                'labels': self._class_labels
+            }
+            
+            # Convert to Python scalars in bulk rather than per element
+            boxes = boxes.tolist()
+            centers = centers.tolist()
+            confidences = data[:, -2].tolist()
+            class_ids = class_id_array.tolist()
+            
+            for box, center, conf, class_id in zip(boxes, centers, confidences, class_ids):
+                x1, y1, x2, y2 = box
+                
+                detection = {
+                    'bbox': [x1, y1, x2, y2],
+                    'confidence': conf,
+                    'class_id': class_id,
+                    'class_name': self._class_labels[class_id],
+                    'center': center
+                }
+                detections.append(detection)
                 
-                for i, (box, conf, class_id) in enumerate(zip(boxes, confidences, class_ids)):
-                    x1, y1, x2, y2 = box.astype(int)
-                    
-                    detection = {
-                        'bbox': [x1, y1, x2, y2],
-                        'confidence': float(conf),
-                        'class_id': int(class_id),
-                        'class_name': self.class_names[class_id] if class_id < len(self.class_names) else f'class_{class_id}',
-                        'center': [(x1 + x2) // 2, (y1 + y2) // 2]
-                    }
-                    detections.append(detection)
-                    
-                    if return_crops:
-                        crop = image[y1:y2, x1:x2]
-                        crops.append(crop)
+                if return_crops:
+                    crop = image[y1:y2, x1:x2]
+                    crops.append(crop)
         
         result_dict = {
             'detections': detections,
-            'num_detections': len(detections)
+            'num_detections': len(detections),
+            'columns': columns
         }
         
         if return_crops:
@@ -198,14 +415,27 @@ class YOLOChessDetector:
         Returns:
             List of (x, y) center coordinates
         """
-        results = self.detect(image)
-        centers = []
+        if self.model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        results = self.model(
+            image,
+            conf=self.confidence_threshold,
+            iou=self.iou_threshold,
+            device=self.device,
+            half=self.half,
+            imgsz=self.img_size
+        )
+        
+        boxes = results[0].boxes
+        if boxes is None or len(boxes) == 0:
+            return []
         
-        for detection in results['detections']:
-            center = detection['center']
-            centers.append((center[0], center[1]))
+        # Compute centers on the inference device and copy back only the result
+        xyxy = boxes.xyxy.int()
+        centers = ((xyxy[:, :2] + xyxy[:, 2:]) // 2).cpu().numpy()
         
-        return centers
+        return [tuple(center) for center in centers.tolist()]
     
     def visualize_detections(
         self,
@@ -228,51 +458,40 @@ class YOLOChessDetector:
         """
         vis_image = image.copy()
         
-        for detection in detections:
-            bbox = detection['bbox']
-            confidence = detection['confidence']
-            class_name = detection['class_name']
-            
-            x1, y1, x2, y2 = bbox
+        # Drawing constants shared by every detection
+        color = (0, 255, 0)
+        text_color = (0, 0, 0)
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        font_scale = 0.5
+        thickness = 1
+        
+        # Format all labels up front
+        if show_class and show_confidence:
+            labels = [f"{d['class_name']} {d['confidence']:.2f}" for d in detections]
+        elif show_class:
+            labels = [d['class_name'] for d in detections]
+        elif show_confidence:
+            labels = [f"{d['confidence']:.2f}" for d in detections]
+        else:
+            labels = None
+        text_sizes = {}
+        
+        for i, detection in enumerate(detections):
+            x1, y1, x2, y2 = detection['bbox']
             
             # Draw bounding box
-            cv2.rectangle(vis_image, (x1, y1), (x2, y2), (0, 255, 0), 2)
+            cv2.rectangle(vis_image, (x1, y1), (x2, y2), color, 2)
             
-            # Draw label
-            label_parts = []
-            if show_class:
-                label_parts.append(class_name)
-            if show_confidence:
-                label_parts.append(f"{confidence:.2f}")
-            
-            if label_parts:
-                label = " ".join(label_parts)
-                
-                # Get text size
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = 0.5
-                thickness = 1
-                (text_width, text_height), _ = cv2.getTextSize(label, font, font_scale, thickness)
+            if labels is not None:
+                label = labels[i]
+                text_size = text_sizes.get(label)
+                if text_size is None:
+                    text_size = text_sizes[label] = cv2.getTextSize(label, font, font_scale, thickness)[0]
+                text_width, text_height = text_size
                 
-                # Draw label background
-                cv2.rectangle(
-                    vis_image,
-                    (x1, y1 - text_height - 5),
-                    (x1 + text_width, y1),
-                    (0, 255, 0),
-                    -1
-                )
-                
-                # Draw label text
-                cv2.putText(
-                    vis_image,
-                    label,
-                    (x1, y1 - 5),
-                    font,
-                    font_scale,
-                    (0, 0, 0),
-                    thickness
-                )
+                # Draw label background and text
+                cv2.rectangle(vis_image, (x1, y1 - text_height - 5), (x1 + text_width, y1), color, -1)
+                cv2.putText(vis_image, label, (x1, y1 - 5), font, font_scale, text_color, thickness)
         
         return vis_image
     
@@ -284,6 +503,10 @@ class YOLOChessDetector:
         return {
             "status": "loaded",
             "device": self.device,
+            "use_tensorrt": self.use_tensorrt,
+            "use_onnx": self.use_onnx,
+            "half": self.half,
+            "img_size": self.img_size,
             "confidence_threshold": self.confidence_threshold,
             "iou_threshold": self.iou_threshold,
             "class_names": self.class_names,
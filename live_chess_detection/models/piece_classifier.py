@@ -14,12 +14,14 @@ try:
     import torch
     import torch.nn as nn
     import torchvision.transforms as transforms
+    from torch.nn.utils.fusion import fuse_conv_bn_eval
     TORCH_AVAILABLE = True
 except ImportError:
     TORCH_AVAILABLE = False
     torch = None
     nn = None
     transforms = None
+    fuse_conv_bn_eval = None
 
 try:
     import tensorflow as tf
@@ -35,6 +37,21 @@ except ImportError:
     VGG16 = None
     MobileNetV2 = None
 
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, quantize_static
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+    ort = None
+    CalibrationDataReader = object
+    QuantFormat = None
+    quantize_static = None
+
+# ImageNet normalization constants in NCHW broadcast layout
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32).reshape(1, 3, 1, 1)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32).reshape(1, 3, 1, 1)
+
 
 class PieceClassifier:
     """
@@ -51,18 +68,26 @@ class PieceClassifier:
         backend: str = "torch",
         device: str = "auto",
         confidence_threshold: float = 0.5,
-        input_size: Tuple[int, int] = (224, 224)
+        input_size: Tuple[int, int] = (224, 224),
+        compile_model: bool = False,
+        batch_size: int = 32
     ):
         """
         Initialize piece classifier.
         
         Args:
             model_path: Path to trained model weights
-            architecture: Model architecture ('resnet50', 'vgg16', 'mobilenet_v2')
-            backend: Backend to use ('torch' or 'tensorflow')
+            architecture: Model architecture ('resnet50', 'vgg16', 'vgg16_gap',
+                'mobilenet_v2'); 'vgg16_gap' replaces VGG16's fully
+                connected head with global average pooling and one linear layer
+            backend: Backend to use ('torch', 'tensorflow' or 'onnx'); 'onnx'
+                runs models produced by export_int8 with ONNX Runtime
             device: Device to run inference on
             confidence_threshold: Minimum confidence for predictions
             input_size: Input image size (height, width)
+            compile_model: Compile the PyTorch model with torch.compile
+                (GPU only, adds a one-off compile cost at load time)
+            batch_size: Number of images per forward pass in classify_batch
         """
         self.model_path = model_path
         self.architecture = architecture
@@ -70,6 +95,13 @@ class PieceClassifier:
         self.device = self._setup_device(device)
         self.confidence_threshold = confidence_threshold
         self.input_size = input_size
+        self.compile_model = compile_model
+        self.batch_size = batch_size
+        
+        # Mixed precision is only used on GPUs with Tensor Cores
+        self._use_amp = False
+        self._amp_dtype = None
+        self._channels_last = False
         
         self.model = None
         self.class_names = self._get_default_class_names()
@@ -108,6 +140,8 @@ class PieceClassifier:
             self._load_torch_model(model_path)
         elif self.backend == "tensorflow":
             self._load_tf_model(model_path)
+        elif self.backend == "onnx":
+            self._load_onnx_model(model_path)
         else:
             raise ValueError(f"Unsupported backend: {self.backend}")
     
@@ -129,9 +163,46 @@ class PieceClassifier:
             self.model.to(self.device)
             self.model.eval()
             
+            # Fold eval-mode BatchNorm into the preceding convolutions
+            _fuse_conv_bn(self.model)
+            
+            # Dropout is a no-op at inference; remove it so the head is plain GEMMs
+            _strip_dropout(self.model)
+            
+            device = torch.device(self.device)
+            self._use_amp = (
+                device.type == "cuda"
+                and torch.cuda.get_device_capability(device)[0] >= 7
+            )
+            if self._use_amp:
+                # BF16 keeps FP32's exponent range, so prefer it where supported
+                self._amp_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            
+            # NHWC layout matches cuDNN's tensor-core conv kernels
+            self._channels_last = device.type == "cuda"
+            if self._channels_last:
+                self.model = self.model.to(memory_format=torch.channels_last)
+            
+            if self.compile_model and self.device != "cpu" and hasattr(torch, "compile"):
+                self._compile_torch_model()
+            
         except Exception as e:
             raise RuntimeError(f"Failed to load PyTorch model: {e}")
     
+    def _compile_torch_model(self):
+        """Compile the loaded model and pay the compile cost up front."""
+        self.model = torch.compile(self.model, mode="reduce-overhead")
+        
+        # Warm up so the first real classification is not slowed by compilation
+        dummy_input = torch.zeros(1, 3, *self.input_size, device=self.device)
+        if self._channels_last:
+            dummy_input = dummy_input.contiguous(memory_format=torch.channels_last)
+        with torch.inference_mode(), torch.autocast(
+            device_type="cuda", dtype=self._amp_dtype, enabled=self._use_amp
+        ):
+            for _ in range(2):
+                self.model(dummy_input)
+    
     def _load_tf_model(self, model_path: Path):
         """Load TensorFlow model."""
         if not TF_AVAILABLE:
@@ -144,6 +215,77 @@ class PieceClassifier:
         except Exception as e:
             raise RuntimeError(f"Failed to load TensorFlow model: {e}")
     
+    def _load_onnx_model(self, model_path: Path):
+        """Load ONNX Runtime model."""
+        if not ORT_AVAILABLE:
+            raise ImportError("onnxruntime is required for onnx backend")
+        
+        try:
+            available = ort.get_available_providers()
+            providers = [
+                provider for provider in ("CUDAExecutionProvider", "CPUExecutionProvider")
+                if provider in available
+            ]
+            self.model = ort.InferenceSession(str(model_path), providers=providers)
+            self._onnx_input_name = self.model.get_inputs()[0].name
+            
+        except Exception as e:
+            raise RuntimeError(f"Failed to load ONNX model: {e}")
+    
+    def export_int8(
+        self,
+        output_path: Union[str, Path],
+        calibration_images: List[np.ndarray],
+        opset_version: int = 17
+    ) -> Path:
+        """
+        Export the loaded PyTorch model as a statically quantized INT8 ONNX model.
+        
+        The FP32 ONNX graph is written next to output_path with an _fp32
+        suffix, then quantized with per-channel QDQ quantization.
+        
+        Args:
+            output_path: Path for the quantized .onnx model
+            calibration_images: Representative piece crops (~200 is enough)
+            opset_version: ONNX opset to export with
+            
+        Returns:
+            Path to the quantized model, loadable with backend='onnx'
+        """
+        if not ORT_AVAILABLE:
+            raise ImportError("onnxruntime is required for INT8 export")
+        if self.backend != "torch" or self.model is None:
+            raise RuntimeError("A loaded PyTorch model is required for INT8 export")
+        
+        output_path = Path(output_path)
+        fp32_path = output_path.with_name(f"{output_path.stem}_fp32.onnx")
+        
+        # Export the uncompiled module; torch.compile wrappers keep it as _orig_mod
+        model = getattr(self.model, "_orig_mod", self.model)
+        dummy_input = torch.zeros(1, 3, *self.input_size, device=self.device)
+        torch.onnx.export(
+            model,
+            dummy_input,
+            str(fp32_path),
+            opset_version=opset_version,
+            input_names=["input"],
+            output_names=["logits"],
+            dynamic_axes={"input": {0: "batch"}, "logits": {0: "batch"}}
+        )
+        
+        calibration_batches = [
+            {"input": self._preprocess_onnx(image)} for image in calibration_images
+        ]
+        quantize_static(
+            str(fp32_path),
+            str(output_path),
+            _ListCalibrationReader(calibration_batches),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True
+        )
+        
+        return output_path
+    
     def _create_torch_model(self) -> nn.Module:
         """Create PyTorch model architecture."""
         if self.architecture == "resnet50":
@@ -152,6 +294,15 @@ class PieceClassifier:
         elif self.architecture == "vgg16":
             from torchvision.models import vgg16
             model = vgg16(pretrained=False, num_classes=len(self.class_names))
+        elif self.architecture == "vgg16_gap":
+            from torchvision.models import vgg16
+            model = vgg16(pretrained=False)
+            # Global average pooling head: ~6k weights instead of ~120M in the FC stack
+            model.avgpool = nn.AdaptiveAvgPool2d(1)
+            model.classifier = nn.Sequential(
+                nn.Dropout(0.5),
+                nn.Linear(512, len(self.class_names))
+            )
         elif self.architecture == "mobilenet_v2":
             from torchvision.models import mobilenet_v2
             model = mobilenet_v2(pretrained=False, num_classes=len(self.class_names))
@@ -174,11 +325,22 @@ class PieceClassifier:
             return self._preprocess_torch(image)
         elif self.backend == "tensorflow":
             return self._preprocess_tf(image)
+        elif self.backend == "onnx":
+            return self._preprocess_onnx(image)
         else:
             raise ValueError(f"Unsupported backend: {self.backend}")
     
-    def _preprocess_torch(self, image: np.ndarray) -> torch.Tensor:
-        """Preprocess image for PyTorch."""
+    def _preprocess_onnx(self, image: np.ndarray) -> np.ndarray:
+        """Preprocess image for ONNX Runtime."""
+        # Resize, scale to [0, 1], swap BGR to RGB and lay out as NCHW in one call
+        swap_rb = len(image.shape) == 3 and image.shape[2] == 3
+        blob = cv2.dnn.blobFromImage(image, 1.0 / 255.0, self.input_size, swapRB=swap_rb)
+        
+        # All supported architectures use ImageNet normalization
+        return (blob - IMAGENET_MEAN) / IMAGENET_STD
+    
+    def _preprocess_torch(self, image: np.ndarray, to_device: bool = True) -> torch.Tensor:
+        """Preprocess image for PyTorch, optionally leaving it on the host."""
         # Convert BGR to RGB
         if len(image.shape) == 3 and image.shape[2] == 3:
             image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
@@ -193,7 +355,7 @@ class PieceClassifier:
         if self.architecture == "resnet50":
             mean = [0.485, 0.456, 0.406]
             std = [0.229, 0.224, 0.225]
-        elif self.architecture == "vgg16":
+        elif self.architecture in ("vgg16", "vgg16_gap"):
             mean = [0.485, 0.456, 0.406]
             std = [0.229, 0.224, 0.225]
         elif self.architecture == "mobilenet_v2":
@@ -209,7 +371,7 @@ class PieceClassifier:
         # Add batch dimension and rearrange dimensions
         image = image.permute(2, 0, 1).unsqueeze(0)
         
-        return image.to(self.device)
+        return image.to(self.device) if to_device else image
     
     def _preprocess_tf(self, image: np.ndarray) -> np.ndarray:
         """Preprocess image for TensorFlow."""
@@ -223,7 +385,7 @@ class PieceClassifier:
         # Preprocess based on architecture
         if self.architecture == "resnet50":
             image = resnet_preprocess(image.astype(np.float32))
-        elif self.architecture == "vgg16":
+        elif self.architecture in ("vgg16", "vgg16_gap"):
             image = vgg_preprocess(image.astype(np.float32))
         elif self.architecture == "mobilenet_v2":
             image = mobilenet_preprocess(image.astype(np.float32))
@@ -258,36 +420,21 @@ class PieceClassifier:
         
         # Run inference
         if self.backend == "torch":
-            with torch.no_grad():
-                outputs = self.model(processed_image)
-                probabilities = torch.softmax(outputs, dim=1)
-                probabilities = probabilities.cpu().numpy()[0]
+            probabilities = self._run_torch_model(processed_image)[0]
         elif self.backend == "tensorflow":
-            probabilities = self.model.predict(processed_image)[0]
+            probabilities = self._run_tf_model(processed_image)[0]
+        elif self.backend == "onnx":
+            probabilities = self._run_onnx_model(processed_image)[0]
         else:
             raise ValueError(f"Unsupported backend: {self.backend}")
         
-        # Get prediction
-        predicted_class_id = np.argmax(probabilities)
-        predicted_class_name = self.class_names[predicted_class_id] if predicted_class_id < len(self.class_names) else f'class_{predicted_class_id}'
-        confidence = float(probabilities[predicted_class_id])
-        
-        result = {
-            'predicted_class_id': int(predicted_class_id),
-            'predicted_class_name': predicted_class_name,
-            'confidence': confidence,
-            'is_confident': confidence >= self.confidence_threshold
-        }
-        
-        if return_probabilities:
-            result['probabilities'] = probabilities
-        
-        return result
+        return self._build_result(probabilities, return_probabilities)
     
     def classify_batch(
         self,
         images: List[np.ndarray],
-        return_probabilities: bool = False
+        return_probabilities: bool = False,
+        batch_size: Optional[int] = None
     ) -> List[Dict]:
         """
         Classify multiple chess pieces.
@@ -295,17 +442,144 @@ class PieceClassifier:
         Args:
             images: List of input images
             return_probabilities: Whether to return class probabilities
+            batch_size: Images per forward pass (defaults to self.batch_size)
             
         Returns:
             List of classification results
         """
+        if self.model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        batch_size = batch_size or self.batch_size
         results = []
-        for image in images:
-            result = self.classify(image, return_probabilities)
-            results.append(result)
+        
+        for start in range(0, len(images), batch_size):
+            chunk = images[start:start + batch_size]
+            
+            # Run one forward pass per chunk instead of one per image
+            if self.backend == "torch":
+                # Build the batch on the host and copy it to the device once
+                batch = torch.cat([self._preprocess_torch(image, to_device=False) for image in chunk])
+                if torch.device(self.device).type == "cuda":
+                    batch = batch.pin_memory().to(self.device, non_blocking=True)
+                else:
+                    batch = batch.to(self.device)
+                probabilities = self._run_torch_model(batch)
+            elif self.backend == "tensorflow":
+                batch = np.concatenate([self.preprocess_image(image) for image in chunk])
+                probabilities = self._run_tf_model(batch)
+            elif self.backend == "onnx":
+                batch = np.concatenate([self.preprocess_image(image) for image in chunk])
+                probabilities = self._run_onnx_model(batch)
+            else:
+                raise ValueError(f"Unsupported backend: {self.backend}")
+            
+            for image_probabilities in probabilities:
+                results.append(self._build_result(image_probabilities, return_probabilities))
         
         return results
     
+    def get_optimal_batch_size(self, start_batch: int = 32, max_batch: int = 1024) -> int:
+        """
+        Find the largest batch size that fits in GPU memory.
+        
+        The batch size is doubled until a forward pass runs out of memory,
+        then binary-searched between the largest passing and smallest
+        failing sizes. The result is stored as self.batch_size.
+        
+        Args:
+            start_batch: First batch size to try
+            max_batch: Upper bound on the returned batch size
+            
+        Returns:
+            Largest batch size known to fit
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+        
+        if self.backend != "torch" or torch.device(self.device).type != "cuda":
+            return self.batch_size
+        
+        def fits(batch_size: int) -> bool:
+            try:
+                dummy_input = torch.zeros(batch_size, 3, *self.input_size, device=self.device)
+                self._run_torch_model(dummy_input)
+                torch.cuda.synchronize()
+                return True
+            except RuntimeError as e:
+                if "out of memory" not in str(e):
+                    raise
+                return False
+            finally:
+                torch.cuda.empty_cache()
+        
+        # lo is the largest size known to fit, hi the smallest known to fail
+        lo, hi = 0, start_batch
+        while hi <= max_batch and fits(hi):
+            lo, hi = hi, hi * 2
+        hi = min(hi, max_batch + 1)
+        
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if fits(mid):
+                lo = mid
+            else:
+                hi = mid
+        
+        self.batch_size = max(lo, 1)
+        return self.batch_size
+    
+    def _run_torch_model(self, batch: torch.Tensor) -> np.ndarray:
+        """Run the PyTorch model on one preprocessed batch."""
+        if self._channels_last:
+            batch = batch.contiguous(memory_format=torch.channels_last)
+        
+        with torch.inference_mode(), torch.autocast(
+            device_type="cuda", dtype=self._amp_dtype, enabled=self._use_amp
+        ):
+            outputs = self.model(batch)
+        # Softmax in FP32 to keep probabilities numerically stable
+        probabilities = torch.softmax(outputs.float(), dim=1)
+        return probabilities.cpu().numpy()
+    
+    def _run_onnx_model(self, batch: np.ndarray) -> np.ndarray:
+        """Run the ONNX Runtime model on one preprocessed batch."""
+        logits = self.model.run(None, {self._onnx_input_name: batch})[0]
+        
+        # Numerically stable softmax
+        exp_logits = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp_logits / exp_logits.sum(axis=1, keepdims=True)
+    
+    def _build_result(
+        self,
+        probabilities: np.ndarray,
+        return_probabilities: bool = False
+    ) -> Dict[str, Union[str, float, np.ndarray]]:
+        """Build a classification result from one probability vector."""
+        # Get prediction
+        predicted_class_id = np.argmax(probabilities)
+        predicted_class_name = self.class_names[predicted_class_id] if predicted_class_id < len(self.class_names) else f'class_{predicted_class_id}'
+        confidence = float(probabilities[predicted_class_id])
+        
+        result = {
+            'predicted_class_id': int(predicted_class_id),
+            'predicted_class_name': predicted_class_name,
+            'confidence': confidence,
+            'is_confident': confidence >= self.confidence_threshold
+        }
+        
+        if return_probabilities:
+            result['probabilities'] = probabilities
+        
+        return result
+    
+    def _run_tf_model(self, processed_image: np.ndarray) -> np.ndarray:
+        """Run the TensorFlow model on one preprocessed batch."""
+        # Calling a Keras model directly skips predict()'s per-call data pipeline
+        if isinstance(self.model, tf.keras.Model):
+            return self.model(processed_image, training=False).numpy()
+        return self.model.predict(processed_image, verbose=0)
+    
     def get_model_info(self) -> Dict:
         """Get model information."""
         if self.model is None:
@@ -318,6 +592,65 @@ class PieceClassifier:
             "device": self.device,
             "confidence_threshold": self.confidence_threshold,
             "input_size": self.input_size,
+            "compile_model": self.compile_model,
             "class_names": self.class_names,
             "num_classes": len(self.class_names)
-        }
\ No newline at end of file
+        }
+
+
+def _fuse_conv_bn(module: nn.Module) -> nn.Module:
+    """
+    Fold BatchNorm2d layers into the Conv2d registered right before them.
+    
+    The fused convolution is numerically equivalent in eval mode, and the
+    BatchNorm is replaced by nn.Identity so state is not applied twice.
+    
+    Args:
+        module: Model in eval mode (modified in place)
+        
+    Returns:
+        The same module
+    """
+    previous_name, previous_child = None, None
+    for name, child in module.named_children():
+        if (
+            isinstance(child, nn.BatchNorm2d)
+            and isinstance(previous_child, nn.Conv2d)
+            and child.num_features == previous_child.out_channels
+        ):
+            setattr(module, previous_name, fuse_conv_bn_eval(previous_child, child))
+            setattr(module, name, nn.Identity())
+        else:
+            _fuse_conv_bn(child)
+        previous_name, previous_child = name, child
+    
+    return module
+
+
+def _strip_dropout(module: nn.Module) -> nn.Module:
+    """
+    Replace every dropout layer with nn.Identity.
+    
+    Args:
+        module: Model used for inference only (modified in place)
+        
+    Returns:
+        The same module
+    """
+    for name, child in module.named_children():
+        if isinstance(child, nn.modules.dropout._DropoutNd):
+            setattr(module, name, nn.Identity())
+        else:
+            _strip_dropout(child)
+    
+    return module
+
+
+class _ListCalibrationReader(CalibrationDataReader):
+    """Feed a fixed list of input dictionaries to ONNX Runtime calibration."""
+    
+    def __init__(self, batches: List[Dict[str, np.ndarray]]):
+        self._batches = iter(batches)
+    
+    def get_next(self) -> Optional[Dict[str, np.ndarray]]:
+        return next(self._batches, None)
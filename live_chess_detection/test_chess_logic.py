@@ -17,8 +17,10 @@ sys.path.insert(0, str(project_root))
 from utils.chess_logic import (
     ChessBoard, square_to_coords, coords_to_square,
     piece_symbol_to_name, validate_fen, get_piece_color,
-    calculate_material_balance
+    calculate_material_balance, PIECE_SYMBOLS, PIECE_TO_IDX,
+    indices_to_fen
 )
+import chess
 
 
 class TestChessBoard:
@@ -82,6 +84,16 @@ class TestChessBoard:
         board2 = ChessBoard()
         assert not board2.make_move('e2e5')
     
+    def test_set_fen(self):
+        """Test resetting the board to another position."""
+        board = ChessBoard()
+        board.make_move('e2e4')
+        
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+        board.set_fen(fen)
+        assert board.get_fen() == fen
+        assert board.move_history == []
+    
     def test_get_board_array(self):
         """Test board array conversion."""
         board = ChessBoard()
@@ -91,6 +103,29 @@ class TestChessBoard:
         assert board_array[0, 0] == 'r'  # a8
         assert board_array[7, 4] == 'K'  # e1
     
+    def test_get_board_indices(self):
+        """Test piece code array conversion."""
+        board = ChessBoard()
+        board_indices = board.get_board_indices()
+        
+        assert board_indices.shape == (8, 8)
+        assert board_indices.dtype == np.int8
+        assert PIECE_SYMBOLS[board_indices[0, 0]] == 'r'  # a8
+        assert PIECE_SYMBOLS[board_indices[7, 4]] == 'K'  # e1
+        assert board_indices[4, 4] == 0  # e4 is empty
+        
+        # Codes agree with the symbol array
+        board_array = board.get_board_array()
+        for row in range(8):
+            for col in range(8):
+                assert PIECE_SYMBOLS[board_indices[row, col]] == board_array[row, col]
+    
+    def test_piece_to_idx(self):
+        """Test symbol to piece code lookup."""
+        for code, symbol in enumerate(PIECE_SYMBOLS[1:], start=1):
+            assert PIECE_TO_IDX[ord(symbol)] == code
+        assert PIECE_TO_IDX[ord('.')] == 0
+    
     def test_game_over_conditions(self):
         """Test game over conditions."""
         board = ChessBoard()
@@ -167,6 +202,20 @@ class TestPieceFunctions:
         assert balance2 == 0
 
 
+class TestBoardIndices:
+    """Test piece code array conversions."""
+    
+    def test_indices_to_fen(self):
+        """Test FEN placement from piece codes matches python-chess."""
+        for fen in [
+            chess.STARTING_FEN,
+            "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1",
+            "8/8/8/8/8/8/8/8 w - - 0 1"
+        ]:
+            board = ChessBoard(fen)
+            assert indices_to_fen(board.get_board_indices()) == board.board.board_fen()
+
+
 class TestFenValidation:
     """Test FEN validation functions."""
     
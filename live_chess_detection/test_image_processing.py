@@ -0,0 +1,143 @@
+"""
+Test suite for image processing utilities.
+
+Tests frame quality estimation and the CPU path of image
+enhancement.
+"""
+
+import pytest
+import numpy as np
+import cv2
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+import utils.image_processing as image_processing
+from utils.image_processing import enhance_image, measure_frame_quality
+
+
+def _make_frame(low: int, high: int, seed: int = 0) -> np.ndarray:
+    """Build a random BGR frame with values in [low, high)."""
+    rng = np.random.default_rng(seed)
+    return rng.integers(low, high, size=(240, 320, 3), dtype=np.uint8)
+
+
+@pytest.fixture(autouse=True)
+def cpu_only(monkeypatch):
+    """Run enhance_image on its CPU path regardless of the OpenCV build."""
+    monkeypatch.setattr(image_processing, 'CUDA_AVAILABLE', False)
+
+
+class TestFrameQuality:
+    """Test frame quality estimation."""
+    
+    def test_flat_frame(self):
+        """Test a uniform frame has no contrast or sharpness."""
+        frame = np.full((240, 320, 3), 128, dtype=np.uint8)
+        contrast, sharpness = measure_frame_quality(frame)
+        
+        assert contrast == 0.0
+        assert sharpness == 0.0
+    
+    def test_noisy_frame(self):
+        """Test a noisy frame scores higher than a blurred copy."""
+        frame = _make_frame(0, 256)
+        blurred = cv2.GaussianBlur(frame, (9, 9), 0)
+        
+        contrast, sharpness = measure_frame_quality(frame)
+        blurred_contrast, blurred_sharpness = measure_frame_quality(blurred)
+        
+        assert contrast > blurred_contrast
+        assert sharpness > blurred_sharpness
+    
+    def test_grayscale_input(self):
+        """Test grayscale frames are accepted."""
+        gray = _make_frame(0, 256)[..., 0]
+        contrast, sharpness = measure_frame_quality(gray)
+        
+        assert contrast > 0
+        assert sharpness > 0
+
+
+class TestEnhanceImage:
+    """Test CPU image enhancement."""
+    
+    def test_clahe_output(self):
+        """Test output matches CLAHE on the LAB lightness channel."""
+        frame = _make_frame(100, 140)
+        
+        lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        lab[..., 0] = clahe.apply(lab[..., 0])
+        expected = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+        
+        enhanced = enhance_image(frame, clip_limit=2.0)
+        
+        assert enhanced.shape == frame.shape
+        assert enhanced.dtype == np.uint8
+        assert np.array_equal(enhanced, expected)
+    
+    def test_input_unchanged(self):
+        """Test the input frame is not modified."""
+        frame = _make_frame(100, 140)
+        original = frame.copy()
+        
+        enhance_image(frame, denoise=True)
+        
+        assert np.array_equal(frame, original)
+    
+    def test_denoise(self):
+        """Test denoising applies the bilateral filter after CLAHE."""
+        frame = _make_frame(100, 140)
+        
+        expected = cv2.bilateralFilter(
+            enhance_image(frame), d=5, sigmaColor=50, sigmaSpace=50
+        )
+        
+        assert np.array_equal(enhance_image(frame, denoise=True), expected)
+    
+    def test_adaptive_skips_clahe(self):
+        """Test a well-contrasted frame skips CLAHE."""
+        frame = _make_frame(0, 256)
+        contrast, _ = measure_frame_quality(frame)
+        
+        enhanced = enhance_image(frame, adaptive=True, contrast_threshold=contrast - 1)
+        
+        assert np.array_equal(enhanced, frame)
+    
+    def test_adaptive_applies_clahe(self):
+        """Test a low-contrast frame is still equalized."""
+        frame = _make_frame(100, 140)
+        contrast, _ = measure_frame_quality(frame)
+        
+        enhanced = enhance_image(frame, adaptive=True, contrast_threshold=contrast + 1)
+        
+        assert np.array_equal(enhanced, enhance_image(frame))
+    
+    def test_adaptive_skips_denoise(self):
+        """Test a soft frame skips denoising."""
+        frame = cv2.GaussianBlur(_make_frame(0, 256), (9, 9), 0)
+        _, sharpness = measure_frame_quality(frame)
+        
+        enhanced = enhance_image(
+            frame, denoise=True, adaptive=True,
+            contrast_threshold=0.0, sharpness_threshold=sharpness + 1
+        )
+        
+        assert np.array_equal(enhanced, frame)
+    
+    def test_adaptive_applies_denoise(self):
+        """Test a sharp frame is still denoised."""
+        frame = _make_frame(0, 256)
+        _, sharpness = measure_frame_quality(frame)
+        
+        enhanced = enhance_image(
+            frame, denoise=True, adaptive=True,
+            contrast_threshold=0.0, sharpness_threshold=sharpness - 1
+        )
+        expected = cv2.bilateralFilter(frame, d=5, sigmaColor=50, sigmaSpace=50)
+        
+        assert np.array_equal(enhanced, expected)
@@ -0,0 +1,201 @@
+"""
+Test suite for inference components.
+
+Tests board state prediction and move validation, including their
+result caching.
+"""
+
+import pytest
+import copy
+import numpy as np
+import chess
+from pathlib import Path
+import sys
+
+# Add the directory containing the package to path, since the inference
+# modules import their siblings relatively
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root.parent))
+
+import live_chess_detection.inference.board_predictor as board_predictor
+import live_chess_detection.utils.chess_logic as chess_logic
+from live_chess_detection.inference.board_predictor import BoardPredictor
+from live_chess_detection.inference.move_validator import MoveValidator
+from live_chess_detection.utils.chess_logic import coords_to_square
+
+
+def _board_positions():
+    """Square centers of a top-down board with 100 px squares."""
+    return {
+        coords_to_square(row, col): (col * 100 + 50, row * 100 + 50)
+        for row in range(8) for col in range(8)
+    }
+
+
+def _detections():
+    """Fixed detections covering placement edge cases."""
+    return [
+        {'class_name': 'white_king', 'center': (452, 748), 'confidence': 0.95},
+        {'class_name': 'black_king', 'center': (448, 52), 'confidence': 0.9},
+        {'class_name': 'white_pawn', 'center': (355, 655), 'confidence': 0.6},
+        # Two pieces on d2; the more confident one wins
+        {'class_name': 'white_pawn', 'center': (350, 640), 'confidence': 0.4},
+        {'class_name': 'white_queen', 'center': (360, 660), 'confidence': 0.8},
+        {'class_name': 'black_rook', 'center': (50, 50), 'confidence': 0.75},
+        {'class_name': 'black_rook', 'center': (60, 40), 'confidence': 0.75},
+        {'class_name': 'black_pawn', 'center': (250, 250), 'confidence': 0.55},
+        {'class_name': 'black_pawn', 'center': (650, 250), 'confidence': 0.3},
+        {'class_name': 'black_knight', 'center': (950, 950), 'confidence': 0.9},
+        {'class_name': 'board', 'center': (150, 150), 'confidence': 0.9}
+    ]
+
+
+class TestBoardPredictor:
+    """Test BoardPredictor functionality."""
+    
+    def test_predict_board_state(self):
+        """Test pieces land on their nearest squares."""
+        predictor = BoardPredictor()
+        result = predictor.predict_board_state(_detections(), _board_positions())
+        
+        assert result['success']
+        assert result['fen'] == 'r3k3/8/2p5/8/8/8/3Q4/4K3 w - - 0 1'
+        assert result['placed_pieces'] == 5
+        assert result['total_detections'] == 11
+    
+    def test_result_caller_owned(self):
+        """Test mutating a result does not change the next one."""
+        predictor = BoardPredictor()
+        board_positions = _board_positions()
+        first = predictor.predict_board_state(_detections(), board_positions)
+        expected_board = first['board'].copy()
+        expected_stats = copy.deepcopy(first['statistics'])
+        
+        first['board'][:] = 0
+        first['piece_confidence'][:] = 0.0
+        first['statistics']['piece_counts']['K'] = 5
+        first['statistics']['low_confidence_pieces'].clear()
+        
+        second = predictor.predict_board_state(_detections(), board_positions)
+        assert second is not first
+        assert np.array_equal(second['board'], expected_board)
+        assert second['statistics'] == expected_stats
+        
+        # Results of different boards do not share buffers either
+        third = predictor.predict_board_state(_detections()[:2], board_positions)
+        assert not np.shares_memory(second['board'], third['board'])
+        assert np.array_equal(second['board'], expected_board)
+    
+    def test_reuse_results(self):
+        """Test reuse_results hands out the internal result."""
+        predictor = BoardPredictor(reuse_results=True)
+        board_positions = _board_positions()
+        first = predictor.predict_board_state(_detections(), board_positions)
+        second = predictor.predict_board_state(_detections(), board_positions)
+        
+        assert second is first
+    
+    @pytest.mark.skipif(not board_predictor.NUMBA_AVAILABLE, reason="numba not installed")
+    def test_numba_matches_numpy(self, monkeypatch):
+        """Test the numba and numpy paths produce the same prediction."""
+        board_positions = _board_positions()
+        with_numba = BoardPredictor().predict_board_state(_detections(), board_positions)
+        
+        monkeypatch.setattr(board_predictor, 'NUMBA_AVAILABLE', False)
+        monkeypatch.setattr(chess_logic, 'NUMBA_AVAILABLE', False)
+        without_numba = BoardPredictor().predict_board_state(_detections(), board_positions)
+        
+        assert with_numba['fen'] == without_numba['fen']
+        assert with_numba['placed_pieces'] == without_numba['placed_pieces']
+        assert with_numba['statistics'] == without_numba['statistics']
+        assert np.array_equal(with_numba['board'], without_numba['board'])
+        assert np.array_equal(with_numba['piece_confidence'], without_numba['piece_confidence'])
+    
+    @pytest.mark.skipif(not board_predictor.SCIPY_AVAILABLE, reason="scipy not installed")
+    def test_kdtree_matches_argmin(self, monkeypatch):
+        """Test the KD-tree and brute-force searches map centers alike."""
+        rng = np.random.default_rng(0)
+        centers = rng.uniform(-150, 950, size=(200, 2)).astype(np.float32)
+        board_positions = _board_positions()
+        
+        monkeypatch.setattr(board_predictor, '_KDTREE_MIN_PAIRS', float('inf'))
+        argmin_squares = BoardPredictor()._map_to_closest_squares(centers, board_positions)
+        
+        monkeypatch.setattr(board_predictor, '_KDTREE_MIN_PAIRS', 0)
+        kdtree_squares = BoardPredictor()._map_to_closest_squares(centers, board_positions)
+        
+        assert (argmin_squares == -1).any()
+        assert np.array_equal(argmin_squares, kdtree_squares)
+
+
+class TestMoveValidator:
+    """Test MoveValidator functionality."""
+    
+    def test_valid_move(self):
+        """Test a legal move is accepted."""
+        validator = MoveValidator()
+        result = validator.validate_move(chess.STARTING_FEN, 'e2e4')
+        
+        assert result['is_valid']
+        assert result['new_fen'].startswith('rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b')
+        assert 'position_analysis' in result
+    
+    def test_illegal_move(self):
+        """Test an illegal move lists the legal moves."""
+        validator = MoveValidator()
+        result = validator.validate_move(chess.STARTING_FEN, 'e2e5')
+        
+        assert not result['is_valid']
+        assert len(result['legal_moves']) == 20
+        assert 'e2e4' in result['legal_moves']
+    
+    def test_illegal_move_without_analysis(self):
+        """Test legal moves are only generated when asked for."""
+        validator = MoveValidator()
+        result = validator.validate_move(chess.STARTING_FEN, 'e2e5', analyze=False)
+        
+        assert not result['is_valid']
+        assert 'legal_moves' not in result
+        assert len(validator.get_legal_moves(chess.STARTING_FEN)) == 20
+    
+    def test_repeated_validation(self):
+        """Test a cached result equals the first one."""
+        validator = MoveValidator()
+        for move in ['e2e4', 'e2e5']:
+            first = validator.validate_move(chess.STARTING_FEN, move)
+            second = validator.validate_move(chess.STARTING_FEN, move)
+            
+            assert second == first
+            assert second is not first
+    
+    def test_cached_result_isolated(self):
+        """Test mutating a returned result does not change the cache."""
+        validator = MoveValidator()
+        expected = validator.validate_move(chess.STARTING_FEN, 'e2e4')
+        
+        result = validator.validate_move(chess.STARTING_FEN, 'e2e4')
+        result['is_valid'] = False
+        result['special_conditions']['is_check'] = True
+        result['position_analysis']['piece_counts']['white'] = 0
+        result['position_analysis']['pins'].append('e1')
+        
+        assert validator.validate_move(chess.STARTING_FEN, 'e2e4') == expected
+    
+    def test_cached_legal_moves_isolated(self):
+        """Test mutating a returned legal move list does not change the cache."""
+        validator = MoveValidator()
+        expected = validator.validate_move(chess.STARTING_FEN, 'e2e5')
+        
+        result = validator.validate_move(chess.STARTING_FEN, 'e2e5')
+        result['legal_moves'].clear()
+        result['reason'] = None
+        
+        assert validator.validate_move(chess.STARTING_FEN, 'e2e5') == expected
+    
+    def test_history_updated_on_cache_hit(self):
+        """Test repeated valid moves still update the position history."""
+        validator = MoveValidator()
+        validator.validate_move(chess.STARTING_FEN, 'e2e4')
+        validator.validate_move(chess.STARTING_FEN, 'e2e4')
+        
+        assert len(validator.position_history) == 2
@@ -36,6 +36,9 @@ class TestYOLOChessDetector:
         """Test device setup."""
         detector = YOLOChessDetector(device="cpu")
         assert detector.device == "cpu"
+        assert detector.half is False
+        assert detector.img_size == 640
+        assert YOLOChessDetector(device="cpu", img_size=320).img_size == 320
         
         detector2 = YOLOChessDetector(device="auto")
         assert detector2.device in ["cpu", "cuda"]
@@ -69,6 +72,14 @@ class TestYOLOChessDetector:
         with pytest.raises(RuntimeError, match="Model not loaded"):
             detector.detect(image)
     
+    def test_detect_batch_without_model(self):
+        """Test batch detection without loaded model."""
+        detector = YOLOChessDetector()
+        images = [np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8) for _ in range(3)]
+        
+        with pytest.raises(RuntimeError, match="Model not loaded"):
+            detector.detect_batch(images)
+    
     def test_detect_pieces_without_model(self):
         """Test piece detection without loaded model."""
         detector = YOLOChessDetector()
@@ -193,6 +204,9 @@ class TestPieceClassifier:
         
         classifier3 = PieceClassifier(architecture="mobilenet_v2")
         assert classifier3.architecture == "mobilenet_v2"
+        
+        classifier4 = PieceClassifier(architecture="vgg16_gap")
+        assert classifier4.architecture == "vgg16_gap"
     
     def test_backend_setup(self):
         """Test backend setup."""
@@ -201,6 +215,9 @@ class TestPieceClassifier:
         
         classifier2 = PieceClassifier(backend="tensorflow")
         assert classifier2.backend == "tensorflow"
+        
+        classifier3 = PieceClassifier(backend="onnx")
+        assert classifier3.backend == "onnx"
     
     def test_input_size(self):
         """Test input size configuration."""
@@ -101,12 +101,14 @@ class ChessVisionApp:
             self.logger.log_error(e, "ChessVisionApp.load_classifier_model")
             return False
     
-    def detect_pieces(self, image: np.ndarray) -> Dict:
+    def detect_pieces(self, image: np.ndarray, visualize: bool = True) -> Dict:
         """
         Detect chess pieces in image.
         
         Args:
             image: Input image
+            visualize: Whether to draw the detections; when False the
+                'visualization' entry is the input image itself
             
         Returns:
             Dictionary containing detection results
@@ -120,19 +122,22 @@ class ChessVisionApp:
             }
         
         try:
-            # Run detection
-            results = self.detector.detect(image, return_crops=True)
+            # Run detection; crops are not part of the result, so skip them
+            results = self.detector.detect(image)
             detections = results['detections']
             
-            # Create visualization
-            vis_image = self.detector.visualize_detections(
-                image, detections, show_confidence=True, show_class=True
-            )
+            # Headless callers skip the frame copy and box drawing
+            vis_image = image
+            if visualize:
+                vis_image = self.detector.visualize_detections(
+                    image, detections, show_confidence=True, show_class=True
+                )
             
             return {
                 'success': True,
                 'detections': detections,
                 'num_detections': len(detections),
+                'columns': results.get('columns'),
                 'visualization': vis_image
             }
             
@@ -179,19 +184,20 @@ class ChessVisionApp:
                 'classification': None
             }
     
-    def predict_board_state(self, image: np.ndarray) -> Dict:
+    def predict_board_state(self, image: np.ndarray, visualize: bool = True) -> Dict:
         """
         Predict board state from image.
         
         Args:
             image: Input image
+            visualize: Whether to draw the detections into 'visualization'
             
         Returns:
             Dictionary containing board state prediction
         """
         try:
             # Detect pieces first
-            detection_results = self.detect_pieces(image)
+            detection_results = self.detect_pieces(image, visualize=visualize)
             if not detection_results['success']:
                 return detection_results
             
@@ -200,9 +206,16 @@ class ChessVisionApp:
             # Create board position mapping (simplified)
             board_positions = self._create_board_mapping(image)
             
+            # The simplified mapping is an even grid from the top-left corner
+            board_extent = (min(image.shape[:2]) // 8) * 8
+            
+            # The array form skips per-detection dictionary access
+            columns = detection_results.get('columns')
+            
             # Predict board state
             board_results = self.board_predictor.predict_board_state(
-                detections, board_positions
+                columns if columns is not None else detections, board_positions,
+                board_bounds=(0, 0, board_extent, board_extent)
             )
             
             return {
@@ -210,7 +223,8 @@ class ChessVisionApp:
                 'detections': detections,
                 'board_state': board_results,
                 'fen': board_results.get('fen', ''),
-                'is_valid': board_results.get('is_valid', False)
+                'is_valid': board_results.get('is_valid', False),
+                'visualization': detection_results['visualization']
             }
             
         except Exception as e:
@@ -218,7 +232,8 @@ class ChessVisionApp:
             return {
                 'success': False,
                 'error': str(e),
-                'board_state': None
+                'board_state': None,
+                'visualization': image
             }
     
     def _create_board_mapping(self, image: np.ndarray) -> Dict[str, Tuple[int, int]]:
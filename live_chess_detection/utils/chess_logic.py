@@ -9,6 +9,43 @@ import chess
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+
+# Piece codes for compact board arrays: 0 is an empty square, 1-6 are the
+# white pieces and 7-12 the black pieces, both in python-chess piece_type order.
+PIECE_SYMBOLS = '.PNBRQKpnbrqk'
+
+# Lookup table from ord(symbol) to piece code
+PIECE_TO_IDX = np.zeros(128, dtype=np.int8)
+for _idx, _symbol in enumerate(PIECE_SYMBOLS[1:], start=1):
+    PIECE_TO_IDX[ord(_symbol)] = _idx
+
+# ASCII bytes of PIECE_SYMBOLS, indexed by piece code
+_SYMBOL_BYTES = np.frombuffer(PIECE_SYMBOLS.encode('ascii'), dtype=np.uint8)
+
+# bytes.translate table from piece codes to FEN characters; the code right
+# after the pieces stands for the '/' rank separator
+_RANK_SEPARATOR_CODE = len(PIECE_SYMBOLS)
+_FEN_TRANSLATION = (PIECE_SYMBOLS + '/').encode('ascii').ljust(256, b'?')
+
+# Material value of each piece type; kings are not counted
+_PIECE_VALUES = (
+    (chess.PAWN, 1), (chess.KNIGHT, 3), (chess.BISHOP, 3),
+    (chess.ROOK, 5), (chess.QUEEN, 9)
+)
+
+# Square names indexed by [row][col], row 0 being the eighth rank
+_SQUARE_NAMES = tuple(
+    tuple(chess.square_name((7 - row) * 8 + col) for col in range(8))
+    for row in range(8)
+)
+
 
 class ChessBoard:
     """
@@ -89,19 +126,41 @@ class ChessBoard:
         """
         board_array = np.full((8, 8), '.', dtype=object)
         
-        for square in chess.SQUARES:
-            piece = self.board.piece_at(square)
-            if piece:
-                row = 7 - (square // 8)
-                col = square % 8
-                board_array[row, col] = piece.symbol()
+        for square, piece in self.board.piece_map().items():
+            board_array[7 - (square >> 3), square & 7] = piece.symbol()
         
         return board_array
     
+    def get_board_indices(self) -> np.ndarray:
+        """
+        Get board as 8x8 array of piece codes.
+        
+        Returns:
+            8x8 int8 array indexing into PIECE_SYMBOLS (0 = empty)
+        """
+        board_indices = np.zeros((8, 8), dtype=np.int8)
+        
+        # piece_map() only visits occupied squares
+        for square, piece in self.board.piece_map().items():
+            code = piece.piece_type if piece.color == chess.WHITE else piece.piece_type + 6
+            board_indices[7 - (square >> 3), square & 7] = code
+        
+        return board_indices
+    
     def get_fen(self) -> str:
         """Get current FEN string."""
         return self.board.fen()
     
+    def set_fen(self, fen: str):
+        """
+        Reset the board to a new position, reusing the board object.
+        
+        Args:
+            fen: FEN string representing board state
+        """
+        self.board.set_fen(fen)
+        self.move_history.clear()
+    
     def is_game_over(self) -> bool:
         """Check if game is over."""
         return self.board.is_game_over()
@@ -127,6 +186,66 @@ class ChessBoard:
             return None
 
 
+if NUMBA_AVAILABLE:
+    @numba.njit
+    def _indices_to_fen_kernel(board_indices, symbol_bytes):
+        """Write the FEN placement field of a piece code board as ASCII bytes."""
+        rows, cols = board_indices.shape
+        out = np.empty(rows * (cols + 1), dtype=np.uint8)
+        n = 0
+        for row in range(rows):
+            if row > 0:
+                out[n] = 47  # '/'
+                n += 1
+            empty = 0
+            for col in range(cols + 1):
+                code = board_indices[row, col] if col < cols else -1
+                if code == 0:
+                    empty += 1
+                    continue
+                if empty >= 10:
+                    out[n] = 48 + empty // 10
+                    n += 1
+                if empty > 0:
+                    out[n] = 48 + empty % 10
+                    n += 1
+                    empty = 0
+                if code > 0:
+                    out[n] = symbol_bytes[code]
+                    n += 1
+        return out, n
+    
+    # Compile at import so the first caller is not stalled by the JIT
+    _indices_to_fen_kernel(np.zeros((8, 8), dtype=np.int8), _SYMBOL_BYTES)
+
+
+def indices_to_fen(board_indices: np.ndarray) -> str:
+    """
+    Build the FEN piece placement field from a piece code array.
+    
+    Args:
+        board_indices: Board array indexing into PIECE_SYMBOLS (0 = empty),
+            rank 8 first
+        
+    Returns:
+        Piece placement field, e.g. 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR'
+    """
+    if NUMBA_AVAILABLE:
+        buffer, length = _indices_to_fen_kernel(board_indices, _SYMBOL_BYTES)
+        return buffer[:length].tobytes().decode('ascii')
+    
+    # Translate codes to symbol bytes and run-length encode the empty
+    # squares with bytes.replace, all without per-cell Python
+    rows, cols = board_indices.shape
+    codes = np.full((rows, cols + 1), _RANK_SEPARATOR_CODE, dtype=np.uint8)
+    codes[:, :-1] = board_indices
+    fen_bytes = codes.tobytes()[:-1].translate(_FEN_TRANSLATION)
+    for count in range(cols, 0, -1):
+        fen_bytes = fen_bytes.replace(b'.' * count, str(count).encode('ascii'))
+    
+    return fen_bytes.decode('ascii')
+
+
 def square_to_coords(square: str) -> Tuple[int, int]:
     """
     Convert square notation to coordinates.
@@ -160,8 +279,7 @@ def coords_to_square(row: int, col: int) -> str:
     if not (0 <= row < 8 and 0 <= col < 8):
         raise ValueError(f"Invalid coordinates: ({row}, {col})")
     
-    square_index = (7 - row) * 8 + col
-    return chess.square_name(square_index)
+    return _SQUARE_NAMES[row][col]
 
 
 def piece_symbol_to_name(symbol: str) -> str:
@@ -229,15 +347,11 @@ def calculate_material_balance(board: ChessBoard) -> int:
     Returns:
         Material balance (positive = white advantage)
     """
-    piece_values = {
-        'P': 1, 'N': 3, 'B': 3, 'R': 5, 'Q': 9, 'K': 0,
-        'p': -1, 'n': -3, 'b': -3, 'r': -5, 'q': -9, 'k': 0
-    }
-    
+    # Count pieces straight from the bitboards instead of visiting squares
     balance = 0
-    for square in chess.SQUARES:
-        piece = board.board.piece_at(square)
-        if piece:
-            balance += piece_values.get(piece.symbol(), 0)
+    for piece_type, value in _PIECE_VALUES:
+        white = chess.popcount(board.board.pieces_mask(piece_type, chess.WHITE))
+        black = chess.popcount(board.board.pieces_mask(piece_type, chess.BLACK))
+        balance += value * (white - black)
     
     return balance
\ No newline at end of file
@@ -7,9 +7,26 @@ perspective correction, and piece localization.
 
 import cv2
 import numpy as np
+from collections import OrderedDict
 from typing import List, Optional, Tuple, Union
 
 
+# Fixed-point remap tables for perspective_correct, keyed on (corners, output_size)
+_WARP_MAP_CACHE = OrderedDict()
+_MAX_WARP_MAP_CACHE = 8
+
+# CLAHE objects for enhance_image, keyed on clip limit
+_CLAHE_CACHE = {}
+
+try:
+    CUDA_AVAILABLE = cv2.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv2.error):
+    CUDA_AVAILABLE = False
+
+# Shared GPU pipeline for enhance_image, created on first use
+_GPU_ENHANCER = None
+
+
 def preprocess_image(
     image: np.ndarray,
     target_size: Tuple[int, int] = (1024, 1024),
@@ -42,7 +59,8 @@ def preprocess_image(
 
 def detect_board_corners(
     image: np.ndarray,
-    method: str = 'contours'
+    method: str = 'contours',
+    max_side: Optional[int] = None
 ) -> Optional[np.ndarray]:
     """
     Detect chess board corners in image.
@@ -50,12 +68,15 @@ def detect_board_corners(
     Args:
         image: Input image
         method: Detection method ('contours', 'hough', 'template')
+        max_side: Longest image side the contour search runs at, e.g. 320
+            for a faster search; corners are then refined at full
+            resolution (None searches the full image)
         
     Returns:
         4x2 array of corner coordinates or None
     """
     if method == 'contours':
-        return _detect_corners_contours(image)
+        return _detect_corners_contours(image, max_side)
     elif method == 'hough':
         return _detect_corners_hough(image)
     elif method == 'template':
@@ -64,8 +85,22 @@ def detect_board_corners(
         raise ValueError(f"Unknown detection method: {method}")
 
 
-def _detect_corners_contours(image: np.ndarray) -> Optional[np.ndarray]:
+def _detect_corners_contours(image: np.ndarray, max_side: Optional[int] = None) -> Optional[np.ndarray]:
     """Detect corners using contour analysis."""
+    # Board outlines survive downscaling, and edge detection cost scales
+    # with pixel count
+    height, width = image.shape[:2]
+    full_image = image
+    
+    # Run the filter chain through OpenCL (T-API) when a device is enabled
+    if cv2.ocl.useOpenCL():
+        image = cv2.UMat(image)
+    
+    scale = 1.0
+    if max_side and max(height, width) > max_side:
+        scale = max_side / max(height, width)
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     
     # Apply Gaussian blur
@@ -73,6 +108,8 @@ def _detect_corners_contours(image: np.ndarray) -> Optional[np.ndarray]:
     
     # Apply Canny edge detection
     edges = cv2.Canny(blurred, 50, 150)
+    if isinstance(edges, cv2.UMat):
+        edges = edges.get()
     
     # Find contours
     contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -89,12 +126,38 @@ def _detect_corners_contours(image: np.ndarray) -> Optional[np.ndarray]:
     
     # Check if we have 4 corners
     if len(approx) == 4:
-        corners = approx.reshape(4, 2)
+        corners = order_corners(approx.reshape(4, 2))
+        if scale != 1.0:
+            corners = _refine_corners(full_image, corners / scale, 1.0 / scale)
         return corners
     
     return None
 
 
+def _refine_corners(image: np.ndarray, corners: np.ndarray, upscale: float) -> np.ndarray:
+    """
+    Refine upscaled corner estimates on the full-resolution image.
+    
+    Args:
+        image: Full-resolution BGR image
+        corners: 4x2 corner estimates in full-resolution coordinates
+        upscale: Factor the estimates were scaled up by; each can be off
+            by about that many pixels
+        
+    Returns:
+        4x2 int32 array of refined corner coordinates
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    
+    # The search window has to cover the error of the downscaled search
+    half_window = 2 * int(np.ceil(upscale)) + 2
+    points = corners.astype(np.float32).reshape(-1, 1, 2)
+    criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 20, 0.1)
+    cv2.cornerSubPix(gray, points, (half_window, half_window), (-1, -1), criteria)
+    
+    return np.round(points.reshape(4, 2)).astype(np.int32)
+
+
 def _detect_corners_hough(image: np.ndarray) -> Optional[np.ndarray]:
     """Detect corners using Hough line detection."""
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -136,14 +199,27 @@ def _detect_corners_hough(image: np.ndarray) -> Optional[np.ndarray]:
     intersections = np.array(intersections)
     
     # Simple approach: find extreme points
-    corners = np.array([
-        intersections[np.argmin(intersections[:, 0] + intersections[:, 1])],  # Top-left
-        intersections[np.argmax(intersections[:, 0] - intersections[:, 1])],  # Top-right
-        intersections[np.argmax(intersections[:, 0] + intersections[:, 1])],  # Bottom-right
-        intersections[np.argmin(intersections[:, 0] - intersections[:, 1])]   # Bottom-left
-    ])
+    return order_corners(intersections)
+
+
+def order_corners(points: np.ndarray) -> np.ndarray:
+    """
+    Order board corners as top-left, top-right, bottom-right, bottom-left.
+    
+    This is the order perspective_correct and BoardPredictor expect, so
+    a homography built from detected corners is not mirrored or rotated.
     
-    return corners
+    Args:
+        points: Nx2 array of candidate corner points (N >= 4)
+        
+    Returns:
+        4x2 array of the extreme points in that order
+    """
+    points = np.asarray(points).reshape(-1, 2)
+    sums = points[:, 0] + points[:, 1]
+    diffs = points[:, 0] - points[:, 1]
+    
+    return points[[sums.argmin(), diffs.argmax(), sums.argmax(), diffs.argmin()]]
 
 
 def _detect_corners_template(image: np.ndarray) -> Optional[np.ndarray]:
@@ -169,6 +245,40 @@ def perspective_correct(
     Returns:
         Perspective-corrected image
     """
+    map1, map2 = _get_warp_maps(corners, output_size)
+    
+    # Apply transformation
+    corrected = cv2.remap(image, map1, map2, cv2.INTER_LINEAR)
+    
+    return corrected
+
+
+def _get_warp_maps(
+    corners: np.ndarray,
+    output_size: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Get cached remap tables equivalent to warping corners onto output_size.
+    
+    With a static camera the corners repeat every frame, so the
+    homography and its CV_16SC2 lookup tables are built once and the
+    per-frame cost is a single cv2.remap.
+    
+    Args:
+        corners: 4x2 array of corner coordinates
+        output_size: Output image size (width, height)
+        
+    Returns:
+        (map1, map2) tables for cv2.remap
+    """
+    src_points = np.ascontiguousarray(corners, dtype=np.float32).reshape(4, 2)
+    key = (src_points.tobytes(), tuple(output_size))
+    
+    maps = _WARP_MAP_CACHE.get(key)
+    if maps is not None:
+        _WARP_MAP_CACHE.move_to_end(key)
+        return maps
+    
     # Define destination points (square board)
     dst_points = np.array([
         [0, 0],
@@ -178,16 +288,19 @@ def perspective_correct(
     ], dtype=np.float32)
     
     # Calculate perspective transform
-    transform_matrix = cv2.getPerspectiveTransform(
-        corners.astype(np.float32), dst_points
-    )
+    transform_matrix = cv2.getPerspectiveTransform(src_points, dst_points)
     
-    # Apply transformation
-    corrected = cv2.warpPerspective(
-        image, transform_matrix, output_size
+    # An identity camera with the homography as rectification gives the warp
+    identity = np.eye(3)
+    maps = cv2.initUndistortRectifyMap(
+        identity, None, transform_matrix, identity, tuple(output_size), cv2.CV_16SC2
     )
     
-    return corrected
+    _WARP_MAP_CACHE[key] = maps
+    if len(_WARP_MAP_CACHE) > _MAX_WARP_MAP_CACHE:
+        _WARP_MAP_CACHE.popitem(last=False)
+    
+    return maps
 
 
 def extract_squares(
@@ -235,6 +348,144 @@ def enhance_contrast(image: np.ndarray, alpha: float = 1.5) -> np.ndarray:
     return cv2.convertScaleAbs(image, alpha=alpha, beta=0)
 
 
+def measure_frame_quality(image: np.ndarray, probe_size: int = 128) -> Tuple[float, float]:
+    """
+    Cheaply estimate contrast and sharpness of a frame.
+    
+    Statistics are taken on a small grayscale thumbnail, so the cost is
+    a fraction of a millisecond regardless of frame size.
+    
+    Args:
+        image: Input BGR or grayscale image
+        probe_size: Side length of the thumbnail used for the estimate
+        
+    Returns:
+        (contrast, sharpness) as grayscale std dev and Laplacian variance
+    """
+    # INTER_AREA would average the whole frame and cost more than it saves
+    small = cv2.resize(image, (probe_size, probe_size), interpolation=cv2.INTER_LINEAR)
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if small.ndim == 3 else small
+    
+    _, std = cv2.meanStdDev(gray)
+    _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_64F))
+    
+    return float(std[0, 0]), float(laplacian_std[0, 0] ** 2)
+
+
+def enhance_image(
+    image: np.ndarray,
+    clip_limit: float = 2.0,
+    denoise: bool = False,
+    adaptive: bool = False,
+    contrast_threshold: float = 45.0,
+    sharpness_threshold: float = 100.0
+) -> np.ndarray:
+    """
+    Enhance board image for detection.
+    
+    Applies CLAHE to the lightness channel. Denoising is opt-in and uses
+    an edge-preserving bilateral filter, which is far cheaper per frame
+    than non-local means and is usually unnecessary for the detector.
+    
+    In adaptive mode a thumbnail preflight decides what is worth doing:
+    well-contrasted frames skip CLAHE, and frames that are already soft
+    skip denoising.
+    
+    When OpenCV is built with CUDA the whole pipeline runs on the GPU.
+    
+    Args:
+        image: Input BGR image
+        clip_limit: CLAHE contrast limit
+        denoise: Whether to smooth sensor noise before returning
+        adaptive: Whether to skip stages the frame does not need
+        contrast_threshold: Grayscale std dev above which CLAHE is skipped
+        sharpness_threshold: Laplacian variance below which denoising is skipped
+        
+    Returns:
+        Enhanced image
+    """
+    equalize = True
+    if adaptive:
+        contrast, sharpness = measure_frame_quality(image)
+        equalize = contrast < contrast_threshold
+        denoise = denoise and sharpness >= sharpness_threshold
+    
+    if equalize and CUDA_AVAILABLE:
+        return _get_gpu_enhancer().enhance(image, clip_limit, denoise)
+    
+    enhanced = image
+    if equalize:
+        clahe = _CLAHE_CACHE.get(clip_limit)
+        if clahe is None:
+            clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(8, 8))
+            _CLAHE_CACHE[clip_limit] = clahe
+        
+        # Equalize the lightness plane in place, leaving chroma untouched
+        lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
+        lab[..., 0] = clahe.apply(lab[..., 0])
+        
+        enhanced = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR, dst=lab)
+    
+    if denoise:
+        enhanced = cv2.bilateralFilter(enhanced, d=5, sigmaColor=50, sigmaSpace=50)
+    
+    return enhanced
+
+
+class _GpuEnhancer:
+    """
+    CUDA version of the enhance_image pipeline.
+    
+    The frame is uploaded once and stays in device memory through the
+    LAB conversion, CLAHE and optional bilateral filter, with the upload
+    buffer and CLAHE objects reused across frames.
+    """
+    
+    def __init__(self):
+        self.stream = cv2.cuda_Stream()
+        self.gpu_frame = cv2.cuda_GpuMat()
+        self.clahe = {}
+    
+    def enhance(self, image: np.ndarray, clip_limit: float, denoise: bool) -> np.ndarray:
+        """
+        Enhance image on the GPU.
+        
+        Args:
+            image: Input BGR image
+            clip_limit: CLAHE contrast limit
+            denoise: Whether to apply the bilateral filter
+            
+        Returns:
+            Enhanced image
+        """
+        clahe = self.clahe.get(clip_limit)
+        if clahe is None:
+            clahe = cv2.cuda.createCLAHE(clipLimit=clip_limit, tileGridSize=(8, 8))
+            self.clahe[clip_limit] = clahe
+        
+        self.gpu_frame.upload(image, self.stream)
+        lab = cv2.cuda.cvtColor(self.gpu_frame, cv2.COLOR_BGR2LAB, stream=self.stream)
+        l, a, b = cv2.cuda.split(lab, stream=self.stream)
+        l = clahe.apply(l, self.stream)
+        lab = cv2.cuda.merge([l, a, b], stream=self.stream)
+        enhanced = cv2.cuda.cvtColor(lab, cv2.COLOR_LAB2BGR, stream=self.stream)
+        
+        if denoise:
+            enhanced = cv2.cuda.bilateralFilter(enhanced, 5, 50, 50, stream=self.stream)
+        
+        result = enhanced.download(self.stream)
+        self.stream.waitForCompletion()
+        return result
+
+
+def _get_gpu_enhancer() -> _GpuEnhancer:
+    """Get the shared GPU enhancement pipeline."""
+    global _GPU_ENHANCER
+    if _GPU_ENHANCER is None:
+        _GPU_ENHANCER = _GpuEnhancer()
+    return _GPU_ENHANCER
+
+
 def apply_gaussian_blur(image: np.ndarray, kernel_size: int = 5) -> np.ndarray:
     """
     Apply Gaussian blur to image.
@@ -20,6 +20,9 @@ def setup_logger(
     """
     Set up logger with console and optional file output.
     
+    Pass message arguments separately (logger.info("%d pieces", n)) rather
+    than pre-formatting them, so records below the level cost nothing.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -88,50 +91,55 @@ class ChessVisionLogger:
     def log_detection(self, num_pieces: int, confidence: float, processing_time: float):
         """Log piece detection results."""
         self.logger.info(
-            f"Detection: {num_pieces} pieces found, "
-            f"avg confidence: {confidence:.3f}, "
-            f"time: {processing_time:.3f}s"
+            "Detection: %d pieces found, avg confidence: %.3f, time: %.3fs",
+            num_pieces, confidence, processing_time
         )
     
     def log_training_start(self, model_name: str, epochs: int, batch_size: int):
         """Log training start."""
         self.logger.info(
-            f"Training started: {model_name}, "
-            f"epochs: {epochs}, batch_size: {batch_size}"
+            "Training started: %s, epochs: %d, batch_size: %d",
+            model_name, epochs, batch_size
         )
     
     def log_training_epoch(self, epoch: int, loss: float, accuracy: float):
         """Log training epoch results."""
-        self.logger.info(
-            f"Epoch {epoch}: loss={loss:.4f}, accuracy={accuracy:.4f}"
-        )
+        self.logger.info("Epoch %d: loss=%.4f, accuracy=%.4f", epoch, loss, accuracy)
     
     def log_training_complete(self, final_accuracy: float, total_time: float):
         """Log training completion."""
         self.logger.info(
-            f"Training complete: accuracy={final_accuracy:.4f}, "
-            f"total_time={total_time:.2f}s"
+            "Training complete: accuracy=%.4f, total_time=%.2fs",
+            final_accuracy, total_time
         )
     
     def log_model_load(self, model_path: str, model_type: str):
         """Log model loading."""
-        self.logger.info(f"Model loaded: {model_path} ({model_type})")
+        self.logger.info("Model loaded: %s (%s)", model_path, model_type)
     
     def log_error(self, error: Exception, context: str = ""):
         """Log error with context."""
-        self.logger.error(f"Error in {context}: {str(error)}", exc_info=True)
-    
-    def log_warning(self, message: str, context: str = ""):
-        """Log warning with context."""
-        self.logger.warning(f"Warning in {context}: {message}")
-    
-    def log_info(self, message: str, context: str = ""):
-        """Log info message with context."""
-        self.logger.info(f"Info in {context}: {message}")
-    
-    def log_debug(self, message: str, context: str = ""):
-        """Log debug message with context."""
-        self.logger.debug(f"Debug in {context}: {message}")
+        self.logger.error("Error in %s: %s", context, error, exc_info=True)
+    
+    def log_warning(self, message: str, context: str = "", *args):
+        """Log warning with context; args are %-formatted into message lazily."""
+        self._log(logging.WARNING, "Warning", message, context, args)
+    
+    def log_info(self, message: str, context: str = "", *args):
+        """Log info message with context; args are %-formatted into message lazily."""
+        self._log(logging.INFO, "Info", message, context, args)
+    
+    def log_debug(self, message: str, context: str = "", *args):
+        """Log debug message with context; args are %-formatted into message lazily."""
+        self._log(logging.DEBUG, "Debug", message, context, args)
+    
+    def _log(self, level: int, prefix: str, message: str, context: str, args: tuple):
+        """Format and emit message only if the level is enabled."""
+        if not self.logger.isEnabledFor(level):
+            return
+        if args:
+            message = message % args
+        self.logger.log(level, "%s in %s: %s", prefix, context, message)
 
 
 # Global logger instance